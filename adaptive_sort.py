@@ -0,0 +1,231 @@
+from bisect import bisect_left, bisect_right
+
+# Runs shorter than this are extended with binary insertion sort
+MIN_MERGE = 32
+
+# Consecutive wins by one run before a merge switches to galloping
+MIN_GALLOP = 7
+
+
+def adaptive_sort(arr, key=None, reverse=False):
+    """
+    Adaptive Hybrid Sort Implementation (run detection + galloping merges)
+
+    Adapts to existing order in the input by:
+    1. Scanning for natural runs: non-descending runs are kept, strictly
+       descending runs are reversed in place (strictness keeps it stable)
+    2. Extending short runs to a minimum length with binary insertion sort
+    3. Merging runs from a stack that keeps their lengths balanced; merges
+       skip elements already in place and gallop (exponential search, then
+       block copies) when one run keeps winning
+
+    Time Complexity:
+    - Best case: O(n) - already sorted, reversed, or a few runs
+    - Average/Worst case: O(n log n)
+
+    Space Complexity: O(n) - keys plus a copy of the left run while merging
+
+    Characteristics:
+    - In-place from the caller's view (modifies and returns the original list)
+    - Stable sort (preserves relative order of equal elements)
+    - key= is called once per element, reverse= keeps stability, like sorted()
+    - Only needs the < operator on keys
+    """
+    n = len(arr)
+    if n < 2:
+        return arr
+
+    # Reversing before and after a stable sort is how sorted() keeps reverse=True stable
+    if reverse:
+        arr.reverse()
+
+    # Keys are computed once; values move alongside them only when they differ
+    if key is None:
+        keys, values = list(arr), None
+    else:
+        keys, values = [key(value) for value in arr], list(arr)
+
+    def count_run(lo):
+        """Length of the run starting at lo, reversing it if it is descending"""
+        hi = lo + 1
+        if hi == n:
+            return 1
+        if keys[hi] < keys[lo]:
+            while hi < n and keys[hi] < keys[hi - 1]:
+                hi += 1
+            keys[lo:hi] = keys[lo:hi][::-1]
+            if values is not None:
+                values[lo:hi] = values[lo:hi][::-1]
+        else:
+            while hi < n and not keys[hi] < keys[hi - 1]:
+                hi += 1
+        return hi - lo
+
+    def binary_insertion_sort(lo, hi, start):
+        """Sort keys[lo:hi] given that keys[lo:start] is already sorted"""
+        for i in range(start, hi):
+            k = keys[i]
+            # bisect_right inserts after equal keys, which keeps the sort stable
+            pos = bisect_right(keys, k, lo, i)
+            if pos < i:
+                keys[pos + 1:i + 1] = keys[pos:i]
+                keys[pos] = k
+                if values is not None:
+                    v = values[i]
+                    values[pos + 1:i + 1] = values[pos:i]
+                    values[pos] = v
+
+    def gallop_right(a, x, lo, hi):
+        """First index in a[lo:hi] whose key is greater than x, probing lo, lo+1, lo+3, lo+7, ..."""
+        last, probe, step = lo, lo, 1
+        while probe < hi and not x < a[probe]:
+            last = probe + 1
+            probe += step
+            step <<= 1
+        return bisect_right(a, x, last, min(probe, hi))
+
+    def gallop_left(a, x, lo, hi):
+        """First index in a[lo:hi] whose key is not less than x, probing like gallop_right"""
+        last, probe, step = lo, lo, 1
+        while probe < hi and a[probe] < x:
+            last = probe + 1
+            probe += step
+            step <<= 1
+        return bisect_left(a, x, last, min(probe, hi))
+
+    min_gallop = MIN_GALLOP
+
+    def merge(lo, mid, hi):
+        """Merge the adjacent sorted runs keys[lo:mid] and keys[mid:hi]"""
+        nonlocal min_gallop
+
+        # Left elements not greater than the right run's first are already in place,
+        # and so are right elements not less than the left run's last
+        lo = gallop_right(keys, keys[mid], lo, mid)
+        if lo == mid:
+            return
+        hi = gallop_left(keys, keys[mid - 1], mid, hi)
+
+        left_keys = keys[lo:mid]
+        left_values = values[lo:mid] if values is not None else None
+        left_len = len(left_keys)
+        i, j, d = 0, mid, lo
+
+        while i < left_len and j < hi:
+            # One element at a time until a run wins min_gallop times in a row
+            left_wins = right_wins = 0
+            while i < left_len and j < hi:
+                if keys[j] < left_keys[i]:
+                    keys[d] = keys[j]
+                    if values is not None:
+                        values[d] = values[j]
+                    j += 1
+                    right_wins += 1
+                    left_wins = 0
+                else:
+                    keys[d] = left_keys[i]
+                    if values is not None:
+                        values[d] = left_values[i]
+                    i += 1
+                    left_wins += 1
+                    right_wins = 0
+                d += 1
+                if left_wins >= min_gallop or right_wins >= min_gallop:
+                    break
+
+            # Galloping: copy whole blocks while the runs stay lopsided
+            while i < left_len and j < hi:
+                k = gallop_right(left_keys, keys[j], i, left_len)
+                copied_left = k - i
+                if copied_left:
+                    keys[d:d + copied_left] = left_keys[i:k]
+                    if values is not None:
+                        values[d:d + copied_left] = left_values[i:k]
+                    d += copied_left
+                    i = k
+                if i == left_len:
+                    break
+
+                k = gallop_left(keys, left_keys[i], j, hi)
+                copied_right = k - j
+                if copied_right:
+                    keys[d:d + copied_right] = keys[j:k]
+                    if values is not None:
+                        values[d:d + copied_right] = values[j:k]
+                    d += copied_right
+                    j = k
+                if j == hi:
+                    break
+
+                if copied_left < MIN_GALLOP and copied_right < MIN_GALLOP:
+                    # Galloping stopped paying off; make it harder to re-enter
+                    min_gallop += 1
+                    break
+                min_gallop = max(1, min_gallop - 1)
+
+        # Whatever is left of the left run fills the gap before the untouched tail
+        if i < left_len:
+            keys[d:d + left_len - i] = left_keys[i:]
+            if values is not None:
+                values[d:d + left_len - i] = left_values[i:]
+
+    # Minimum run length: n / minrun is a power of two or a little less (as in Timsort)
+    minrun, remainder = n, 0
+    while minrun >= MIN_MERGE:
+        remainder |= minrun & 1
+        minrun >>= 1
+    minrun += remainder
+
+    runs = []  # (start, length) of the pending runs
+
+    def merge_at(index):
+        start, length = runs[index]
+        _, next_length = runs[index + 1]
+        merge(start, start + length, start + length + next_length)
+        runs[index:index + 2] = [(start, length + next_length)]
+
+    lo = 0
+    while lo < n:
+        length = count_run(lo)
+        if length < minrun:
+            forced = min(minrun, n - lo)
+            binary_insertion_sort(lo, lo + forced, lo + length)
+            length = forced
+        runs.append((lo, length))
+        lo += length
+
+        # Keep run lengths growing faster than Fibonacci down the stack
+        while len(runs) > 1:
+            top = len(runs) - 2
+            if (top > 0 and runs[top - 1][1] <= runs[top][1] + runs[top + 1][1]) or \
+                    (top > 1 and runs[top - 2][1] <= runs[top - 1][1] + runs[top][1]):
+                if runs[top - 1][1] < runs[top + 1][1]:
+                    top -= 1
+            elif runs[top][1] > runs[top + 1][1]:
+                break
+            merge_at(top)
+
+    while len(runs) > 1:
+        merge_at(len(runs) - 2)
+
+    arr[:] = keys if values is None else values
+    if reverse:
+        arr.reverse()
+    return arr
+
+
+# Example usage and testing
+if __name__ == "__main__":
+    test_array = [64, 34, 25, 12, 22, 11, 90, 5]
+    print("Original array:", test_array)
+    print("Adaptive-sorted array:", adaptive_sort(test_array.copy()))
+
+    # Stability: records with equal keys keep their original order
+    records = [("alice", 3), ("bob", 1), ("carol", 3), ("dave", 2), ("erin", 1)]
+    print("Sorted by score:", adaptive_sort(records.copy(), key=lambda record: record[1]))
+    print("Descending:", adaptive_sort(records.copy(), key=lambda record: record[1], reverse=True))
+
+    print("\nAdaptive Sort Advantages:")
+    print("- Close to linear time on sorted, reversed and nearly-sorted input")
+    print("- Stable, with key= and reverse= like sorted()")
+    print("- Binary insertion sort keeps tiny partitions cheap")
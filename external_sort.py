@@ -0,0 +1,163 @@
+"""
+External Merge Sort for files larger than memory
+
+The input is streamed line by line into chunks that fit a memory budget.
+Each chunk is sorted in memory with introsort and spilled to a temporary
+file as a sorted run; the runs are then k-way merged with a heap, reading
+and writing through large buffers.
+
+Usage:
+    python external_sort.py input.txt output.txt --memory 256M --numeric
+    python external_sort.py export.csv sorted.csv --field 2 --delimiter ,
+"""
+
+import heapq
+import os
+import sys
+import tempfile
+
+from quicksort import introsort
+
+# Per-record cost of the (key, line) tuple and its list slot, on top of the key and line
+RECORD_OVERHEAD = 64
+
+
+def parse_size(text):
+    """Parse a byte count such as 1048576, 512K, 64M or 2G"""
+    units = {'K': 1 << 10, 'M': 1 << 20, 'G': 1 << 30}
+    text = text.strip().upper().rstrip('B')
+    if text and text[-1] in units:
+        return int(float(text[:-1]) * units[text[-1]])
+    return int(text)
+
+
+def make_key(numeric=False, field=None, delimiter=None):
+    """
+    Build the sort key for a line
+
+    Args:
+        numeric (bool): Compare as numbers instead of text
+        field (int): Sort on this 0-based field instead of the whole line
+        delimiter (str): Field separator (None splits on whitespace)
+    """
+    def key(line):
+        value = line.rstrip('\r\n')
+        if field is not None:
+            value = value.split(delimiter)[field]
+        return float(value) if numeric else value
+    return key
+
+
+def _spill(records, temp_dir, buffer_size):
+    """Sort one chunk of (key, line) pairs and write it out as a run file"""
+    introsort(records)
+    fd, path = tempfile.mkstemp(prefix='run-', suffix='.txt', dir=temp_dir)
+    with open(fd, 'w', buffering=buffer_size, encoding='utf-8', newline='') as run:
+        run.writelines(line for _, line in records)
+    return path
+
+
+def _merge(paths, output, key, buffer_size):
+    """K-way merge sorted run files into an open output file"""
+    runs = [open(path, buffering=buffer_size, encoding='utf-8', newline='') for path in paths]
+    try:
+        output.writelines(heapq.merge(*runs, key=key))
+    finally:
+        for run in runs:
+            run.close()
+
+
+def external_sort(input_path, output_path, memory_limit=64 << 20, numeric=False, field=None,
+                  delimiter=None, temp_dir=None, buffer_size=1 << 20, max_fan_in=64):
+    """
+    Sort the lines of a file that may not fit in memory
+
+    Args:
+        input_path (str): File to sort, one record or number per line
+        output_path (str): Where the sorted lines are written (may equal input_path)
+        memory_limit (int): Approximate bytes of records held in memory per chunk
+        numeric (bool): Compare as numbers instead of text
+        field (int): Sort on this 0-based field of each line
+        delimiter (str): Field separator (None splits on whitespace)
+        temp_dir (str): Directory for the sorted runs (system default if None)
+        buffer_size (int): I/O buffer size per open run and for the output
+        max_fan_in (int): Most runs merged at once; more runs are merged in passes
+
+    Returns the number of runs spilled. Equal keys are ordered by the
+    line text, so the result does not depend on the memory limit.
+    """
+    if memory_limit < 1:
+        raise ValueError("memory_limit must be positive")
+    if max_fan_in < 2:
+        raise ValueError("max_fan_in must be at least 2")
+
+    key = make_key(numeric, field, delimiter)
+
+    def pair_key(line):
+        return (key(line), line)
+
+    with tempfile.TemporaryDirectory(dir=temp_dir) as run_dir:
+        # Pass 1: sorted runs that each fit the memory budget
+        runs = []
+        records = []
+        used = 0
+        with open(input_path, buffering=buffer_size, encoding='utf-8', newline='') as source:
+            for line in source:
+                if not line.endswith('\n'):
+                    line += '\n'  # Final line without a newline
+                # The key is a separate object (a stripped copy of the line, a field or a float)
+                record_key = key(line)
+                records.append((record_key, line))
+                used += sys.getsizeof(line) + sys.getsizeof(record_key) + RECORD_OVERHEAD
+                if used >= memory_limit:
+                    runs.append(_spill(records, run_dir, buffer_size))
+                    records = []
+                    used = 0
+        if records or not runs:
+            runs.append(_spill(records, run_dir, buffer_size))
+        spilled = len(runs)
+
+        # Extra passes keep the number of open files bounded
+        while len(runs) > max_fan_in:
+            merged = []
+            for start in range(0, len(runs), max_fan_in):
+                group = runs[start:start + max_fan_in]
+                fd, path = tempfile.mkstemp(prefix='merge-', suffix='.txt', dir=run_dir)
+                with open(fd, 'w', buffering=buffer_size, encoding='utf-8', newline='') as output:
+                    _merge(group, output, pair_key, buffer_size)
+                for run in group:
+                    os.remove(run)
+                merged.append(path)
+            runs = merged
+
+        # Final pass straight into the output
+        with open(output_path, 'w', buffering=buffer_size, encoding='utf-8', newline='') as output:
+            _merge(runs, output, pair_key, buffer_size)
+
+    return spilled
+
+
+def main(argv=None):
+    """Command-line entry point"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Sort a file larger than memory")
+    parser.add_argument('input_path')
+    parser.add_argument('output_path')
+    parser.add_argument('--memory', type=parse_size, default=64 << 20,
+                        help="memory budget for each in-memory chunk, e.g. 256M")
+    parser.add_argument('--numeric', action='store_true', help="compare as numbers")
+    parser.add_argument('--field', type=int, help="0-based field to sort on")
+    parser.add_argument('--delimiter', help="field separator (default: whitespace)")
+    parser.add_argument('--temp-dir', help="directory for the sorted runs")
+    parser.add_argument('--buffer-size', type=parse_size, default=1 << 20)
+    args = parser.parse_args(argv)
+
+    runs = external_sort(args.input_path, args.output_path, memory_limit=args.memory,
+                         numeric=args.numeric, field=args.field, delimiter=args.delimiter,
+                         temp_dir=args.temp_dir, buffer_size=args.buffer_size)
+    print(f"Sorted {args.input_path} into {args.output_path} using {runs} run(s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,99 @@
+from bisect import bisect_right, insort
+from collections import OrderedDict
+
+# Factorials kept for reuse, least recently used evicted first
+FACTORIAL_CACHE_SIZE = 32
+
+# Smaller results are cheap to recompute and are not cached
+CACHE_MIN_N = 256
+
+# Factors multiplied by a plain loop at the leaves of the product tree
+PRODUCT_LEAF_SIZE = 16
+
+_checkpoints = OrderedDict()  # n -> n!, in least-recently-used order
+_checkpoint_keys = []  # the same n values, sorted for bisecting
+
+
+def _validate(n):
+    """Raise the same errors for every factorial entry point"""
+    if not isinstance(n, int):
+        raise TypeError("Input must be an integer")
+    if n < 0:
+        raise ValueError("Factorial is not defined for negative numbers")
+
+
+def _range_product(low, high):
+    """
+    Product of the integers low..high (inclusive) by binary splitting
+    
+    Neighbouring partial products are multiplied pairwise, level by level, so
+    both operands of each multiplication are about the same size instead of
+    one huge product absorbing one small factor at a time.
+    """
+    if low > high:
+        return 1
+    products = []
+    for start in range(low, high + 1, PRODUCT_LEAF_SIZE):
+        product = 1
+        for k in range(start, min(start + PRODUCT_LEAF_SIZE, high + 1)):
+            product *= k
+        products.append(product)
+    while len(products) > 1:
+        paired = [products[i] * products[i + 1] for i in range(0, len(products) - 1, 2)]
+        if len(products) % 2:
+            paired.append(products[-1])
+        products = paired
+    return products[0]
+
+
+def clear_factorial_cache():
+    """Forget every cached factorial"""
+    _checkpoints.clear()
+    _checkpoint_keys.clear()
+
+
 def factorial(n):
+    """
+    Calculate the factorial of a non-negative integer without recursion.
+    
+    The product 1 * 2 * ... * n is multiplied as a balanced tree (binary
+    splitting). Results for n >= CACHE_MIN_N are kept in a bounded cache,
+    so a repeated call is a lookup and a call just above a cached m only
+    multiplies m! by the product of m+1..n.
+    
+    Args:
+        n (int): A non-negative integer
+        
+    Returns:
+        int: The factorial of n
+        
+    Raises:
+        ValueError: If n is negative
+        TypeError: If n is not an integer
+    """
+    _validate(n)
+    
+    # Closest cached checkpoint at or below n
+    index = bisect_right(_checkpoint_keys, n)
+    if index:
+        start = _checkpoint_keys[index - 1]
+        result = _checkpoints[start]
+        _checkpoints.move_to_end(start)
+    else:
+        start, result = 1, 1
+    
+    if start != n:
+        result *= _range_product(start + 1, n)
+        if n >= CACHE_MIN_N:
+            _checkpoints[n] = result
+            insort(_checkpoint_keys, n)
+            if len(_checkpoints) > FACTORIAL_CACHE_SIZE:
+                evicted, _ = _checkpoints.popitem(last=False)
+                _checkpoint_keys.remove(evicted)
+    return result
+
+
+def factorial_recursive(n):
     """
     Calculate the factorial of a non-negative integer using recursion.
     
@@ -16,13 +111,8 @@ def factorial(n):
         TypeError: If n is not an integer
     """
     
-    # Base case 1: Check if input is an integer
-    if not isinstance(n, int):
-        raise TypeError("Input must be an integer")
-    
-    # Base case 2: Check for negative numbers
-    if n < 0:
-        raise ValueError("Factorial is not defined for negative numbers")
+    # Base cases 1 and 2: Check that the input is a non-negative integer
+    _validate(n)
     
     # Base case 3: Factorial of 0 is 1 (termination condition)
     if n == 0:
@@ -31,7 +121,7 @@ def factorial(n):
     # Recursive case: n! = n * (n-1)!
     # The function calls itself with a smaller value (n-1)
     # This creates a chain of recursive calls until we reach the base case
-    return n * factorial(n - 1)
+    return n * factorial_recursive(n - 1)
 
 
 # Example usage and demonstration
@@ -43,11 +133,15 @@ if __name__ == "__main__":
     print("=" * 30)
     
     for num in test_values:
-        result = factorial(num)
+        result = factorial_recursive(num)
         print(f"{num}! = {result}")
     
+    # The iterative engine handles n far beyond the recursion limit
+    big = factorial(20000)
+    print(f"20000! = a {big.bit_length()}-bit integer (factorial_recursive would hit the recursion limit)")
+    
     print("\n" + "=" * 30)
-    print("ALGORITHM FLOW SUMMARY:")
+    print("ALGORITHM FLOW SUMMARY (factorial_recursive):")
     print("=" * 30)
     print("""
 1. INPUT VALIDATION:
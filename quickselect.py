@@ -0,0 +1,204 @@
+"""
+Quickselect: order statistics without a full sort
+
+Finds the k-th smallest element, the k smallest (or largest) elements, or a
+batch of percentiles in O(n) expected time by partitioning only the side of
+each split that still holds a wanted rank. Built on the three-way partition
+from quicksort.py, so repeated values do not slow it down.
+
+Partitioning in interpreted Python loses to the C sort in practice: on a
+million floats the selection takes 2-3x as long as sorted(). So unless a
+pivot strategy is asked for, top_k uses heapq (or sorted() when k is a
+large share of n) and percentiles use NumPy's introselect on numeric data,
+falling back to sorted(). Passing pivot= selects the pure-Python quickselect.
+
+Usage:
+    python quickselect.py
+"""
+
+import heapq
+import math
+import random
+from bisect import bisect_left, bisect_right
+
+from quicksort import INSERTION_SORT_THRESHOLD, _numeric_typecode, introsort, partition_three_way
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; percentiles fall back to sorted() without it
+    np = None
+
+PIVOT_STRATEGIES = ('random', 'median_of_medians')
+
+# heapq.nsmallest/nlargest beat sorted() while k is below about n/25
+HEAP_SELECT_MAX_FRACTION = 32
+
+# Group size for median-of-medians; 5 is the smallest that keeps selection linear
+GROUP_SIZE = 5
+
+
+def _median_of_medians(arr, low, high):
+    """Pivot value with at least ~30% of arr[low:high + 1] on either side of it"""
+    medians = []
+    for start in range(low, high + 1, GROUP_SIZE):
+        group = introsort(arr[start:min(start + GROUP_SIZE, high + 1)])
+        medians.append(group[(len(group) - 1) // 2])
+    return nth_element(medians, (len(medians) - 1) // 2, pivot='median_of_medians')
+
+
+def _select_ranks(arr, ranks, pivot):
+    """
+    Rearrange arr so that every index in ranks holds the value it would hold
+    if arr were sorted; ranks must be sorted and unique
+
+    Each partition settles the ranks that land among the pivot's equals and
+    splits the rest between the two sides, so a batch of ranks shares the
+    partitioning work near the root.
+    """
+    # Random pivots fall back to median-of-medians after too many partitioning levels
+    max_depth = 2 * len(arr).bit_length()
+    stack = [(0, len(arr) - 1, 0, len(ranks), max_depth)]
+    while stack:
+        low, high, first, last, depth = stack.pop()
+        while first < last and low < high:
+            if high - low + 1 <= INSERTION_SORT_THRESHOLD:
+                arr[low:high + 1] = introsort(arr[low:high + 1])
+                break
+            if pivot == 'median_of_medians' or depth == 0:
+                value = _median_of_medians(arr, low, high)
+            else:
+                value = arr[random.randint(low, high)]
+                depth -= 1
+
+            lt, gt = partition_three_way(arr, low, high, value)
+            # ranks[first:left_end] lie left of the pivot's equals, ranks[right_start:last] right of them
+            left_end = bisect_left(ranks, lt, first, last)
+            right_start = bisect_right(ranks, gt, left_end, last)
+            if right_start < last:
+                stack.append((gt + 1, high, right_start, last, depth))
+            high, last = lt - 1, left_end
+
+
+def nth_element(arr, k, pivot='random'):
+    """
+    Quickselect the k-th smallest element (0-based) in place
+
+    Afterwards arr[k] holds the value it would have if arr were sorted, with
+    nothing greater before it and nothing smaller after it. Being pure
+    Python, this is slower than sorting a large list with sorted().
+
+    Args:
+        arr (list): Sequence rearranged in place
+        k (int): Rank to select, 0 for the minimum
+        pivot (str): 'random' (expected O(n), falling back to median-of-medians
+            on unlucky inputs) or 'median_of_medians' (deterministic O(n))
+
+    Returns arr[k].
+    """
+    if pivot not in PIVOT_STRATEGIES:
+        raise ValueError(f"pivot must be one of {', '.join(PIVOT_STRATEGIES)}")
+    if not 0 <= k < len(arr):
+        raise ValueError("k must be between 0 and len(arr) - 1")
+    _select_ranks(arr, [k], pivot)
+    return arr[k]
+
+
+def top_k(arr, k, ordered=True, largest=False, pivot=None):
+    """
+    The k smallest (or largest) elements of arr, without sorting all of it
+
+    Args:
+        arr (iterable): Values to select from; left unchanged
+        k (int): Number of elements to return
+        ordered (bool): Sort the result (ascending, or descending when largest);
+            otherwise the k elements come in no particular order
+        largest (bool): Select the k largest instead of the k smallest
+        pivot (str): Pivot strategy, as in nth_element, to use quickselect;
+            None picks heapq or sorted(), which are faster in practice
+
+    Time Complexity: O(n) selection plus O(k log k) when ordered; O(n log k)
+    with heapq
+    """
+    if k < 0:
+        raise ValueError("k must be non-negative")
+    if pivot is not None and pivot not in PIVOT_STRATEGIES:
+        raise ValueError(f"pivot must be one of {', '.join(PIVOT_STRATEGIES)}")
+    work = list(arr)
+    n = len(work)
+    if k == 0:
+        return []
+
+    if pivot is None:
+        # Both return the selection already ordered
+        if k * HEAP_SELECT_MAX_FRACTION <= n:
+            return heapq.nlargest(k, work) if largest else heapq.nsmallest(k, work)
+        work.sort(reverse=largest)
+        return work[:k]
+
+    if k < n:
+        boundary = n - k if largest else k - 1
+        nth_element(work, boundary, pivot)
+        work = work[boundary:] if largest else work[:k]
+    if ordered:
+        introsort(work)
+        if largest:
+            work.reverse()
+    return work
+
+
+def percentiles(arr, fractions, pivot=None):
+    """
+    Nearest-rank percentiles of arr for several fractions at once
+
+    All ranks are selected in one pass over a shared partition tree, so
+    p50/p95/p99 together cost little more than one of them.
+
+    Args:
+        arr (iterable): Samples; left unchanged
+        fractions (iterable of float): Percentiles as fractions, e.g. [0.5, 0.95, 0.99]
+        pivot (str): Pivot strategy, as in nth_element, to use quickselect;
+            None selects with NumPy for numeric samples when it is installed,
+            otherwise sorts a copy with sorted()
+
+    Returns the percentile values in the order of fractions (None for each
+    when arr is empty).
+    """
+    if pivot is not None and pivot not in PIVOT_STRATEGIES:
+        raise ValueError(f"pivot must be one of {', '.join(PIVOT_STRATEGIES)}")
+    fractions = list(fractions)
+    if any(not 0 <= fraction <= 1 for fraction in fractions):
+        raise ValueError("fractions must be between 0 and 1")
+    work = list(arr)
+    if not work:
+        return [None] * len(fractions)
+
+    ranks = [max(1, math.ceil(len(work) * fraction)) - 1 for fraction in fractions]
+    if pivot is not None:
+        _select_ranks(work, sorted(set(ranks)), pivot)
+        return [work[rank] for rank in ranks]
+    typecode = _numeric_typecode(work)
+    if np is not None and typecode is not None:
+        # Index the samples themselves so the results keep their Python types
+        order = np.argpartition(np.array(work, dtype=typecode), sorted(set(ranks)))
+        return [work[order[rank]] for rank in ranks]
+    work.sort()
+    return [work[rank] for rank in ranks]
+
+
+# Example usage and testing
+if __name__ == "__main__":
+    samples = [random.expovariate(1 / 20) for _ in range(100_000)]
+    p50, p95, p99 = percentiles(samples, [0.50, 0.95, 0.99])
+    print(f"Latency p50={p50:.2f}ms p95={p95:.2f}ms p99={p99:.2f}ms")
+
+    test_array = [64, 34, 25, 12, 22, 11, 90, 5]
+    print("Original array:", test_array)
+    print("3rd smallest:", nth_element(test_array.copy(), 2))
+    print("3 smallest:", top_k(test_array, 3))
+    print("3 largest:", top_k(test_array, 3, largest=True))
+
+    print("\nQuickselect Advantages:")
+    print("- O(n) expected for one rank instead of O(n log n) for a full sort")
+    print("- Batch percentiles share partitioning work")
+    print("- heapq, NumPy or sorted() by default, as pure-Python partitioning is slower")
+    print("- Median-of-medians pivots give a deterministic O(n) worst case")
@@ -1,3 +1,64 @@
+import multiprocessing
+import os
+import random
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import groupby
+from multiprocessing import shared_memory
+
+
+def partition(arr, low, high):
+    """
+    Partition function that places the pivot element in its correct position
+    and arranges all smaller elements to the left and larger to the right
+    
+    Args:
+        arr (list): Sequence partitioned in place
+        low, high (int): Inclusive bounds of the range; arr[high] is the pivot
+    
+    Returns the pivot's final index.
+    """
+    # Choose the rightmost element as pivot
+    pivot = arr[high]
+    
+    # Index of smaller element (indicates right position of pivot)
+    i = low - 1
+    
+    for j in range(low, high):
+        # If current element is smaller than or equal to pivot
+        if arr[j] <= pivot:
+            i += 1
+            # Swap arr[i] and arr[j]
+            arr[i], arr[j] = arr[j], arr[i]
+    
+    # Place pivot in correct position
+    arr[i + 1], arr[high] = arr[high], arr[i + 1]
+    return i + 1
+
+
+def partition_three_way(arr, low, high, pivot):
+    """
+    Three-way partition around a pivot value: returns (lt, gt) such that
+    arr[low:lt] < pivot, arr[lt:gt + 1] == pivot and arr[gt + 1:high + 1] > pivot
+    
+    Unlike partition(), runs of elements equal to the pivot are split off in
+    one pass, so repeated values cannot make the caller quadratic.
+    """
+    lt, i, gt = low, low, high
+    while i <= gt:
+        value = arr[i]
+        if value < pivot:
+            arr[lt], arr[i] = value, arr[lt]
+            lt += 1
+            i += 1
+        elif pivot < value:
+            arr[i], arr[gt] = arr[gt], value
+            gt -= 1
+        else:
+            i += 1
+    return lt, gt
+
+
 def quicksort(arr):
     """
     QuickSort Algorithm Implementation
@@ -28,30 +89,303 @@ def quicksort(arr):
             _quicksort(arr, low, pivot_index - 1)
             _quicksort(arr, pivot_index + 1, high)
     
-    def partition(arr, low, high):
-        """
-        Partition function that places the pivot element in its correct position
-        and arranges all smaller elements to the left and larger to the right
-        """
-        # Choose the rightmost element as pivot
-        pivot = arr[high]
+    # Start the sorting process
+    _quicksort(arr, 0, len(arr) - 1)
+    return arr
+
+# Ranges at or below this size are finished with insertion sort
+INSERTION_SORT_THRESHOLD = 16
+
+# Ranges above this size pick the pivot with Tukey's ninther instead of median-of-three
+NINTHER_THRESHOLD = 40
+
+
+def introsort(arr):
+    """
+    Introsort: production-grade QuickSort with guaranteed O(n log n) time
+    
+    Improves on quicksort() where it degrades:
+    1. Median-of-three pivot (Tukey's ninther for large ranges), so sorted and
+       reverse-sorted input partition evenly
+    2. Three-way (Dutch national flag) partition, so runs of equal elements
+       are placed once and never revisited
+    3. An explicit stack instead of recursion; the smaller side is always
+       handled first, so the stack never holds more than O(log n) ranges
+    4. Heapsort for any range still unsorted after 2·log2(n) partitioning
+       levels, and insertion sort for small ranges
+    
+    Time Complexity: O(n log n) worst case
+    Space Complexity: O(log n) - the explicit stack
+    
+    Characteristics:
+    - In-place sorting (modifies the original array)
+    - Unstable sort (may change relative order of equal elements)
+    - Only needs the < operator on elements
+    """
+    
+    def insertion_sort(arr, low, high):
+        for i in range(low + 1, high + 1):
+            value = arr[i]
+            j = i - 1
+            while j >= low and value < arr[j]:
+                arr[j + 1] = arr[j]
+                j -= 1
+            arr[j + 1] = value
+    
+    def median_of_three(arr, a, b, c):
+        """Index of the median of arr[a], arr[b] and arr[c]"""
+        if arr[a] < arr[b]:
+            if arr[b] < arr[c]:
+                return b
+            return c if arr[a] < arr[c] else a
+        if arr[a] < arr[c]:
+            return a
+        return c if arr[b] < arr[c] else b
+    
+    def choose_pivot(arr, low, high):
+        mid = (low + high) // 2
+        if high - low + 1 > NINTHER_THRESHOLD:
+            # Median of the medians of three evenly spread triples
+            step = (high - low + 1) // 8
+            return median_of_three(
+                arr,
+                median_of_three(arr, low, low + step, low + 2 * step),
+                median_of_three(arr, mid - step, mid, mid + step),
+                median_of_three(arr, high - 2 * step, high - step, high)
+            )
+        return median_of_three(arr, low, mid, high)
+    
+    def heapsort(arr, low, high):
+        """Heapsort arr[low:high + 1] in place"""
+        size = high - low + 1
         
-        # Index of smaller element (indicates right position of pivot)
-        i = low - 1
+        def sift_down(root, end):
+            # Max-heap over arr[low:low + end], children of k at 2k+1 and 2k+2
+            value = arr[low + root]
+            child = 2 * root + 1
+            while child < end:
+                if child + 1 < end and arr[low + child] < arr[low + child + 1]:
+                    child += 1
+                if not value < arr[low + child]:
+                    break
+                arr[low + root] = arr[low + child]
+                root = child
+                child = 2 * root + 1
+            arr[low + root] = value
         
-        for j in range(low, high):
-            # If current element is smaller than or equal to pivot
-            if arr[j] <= pivot:
-                i += 1
-                # Swap arr[i] and arr[j]
-                arr[i], arr[j] = arr[j], arr[i]
+        for root in range(size // 2 - 1, -1, -1):
+            sift_down(root, size)
+        for end in range(size - 1, 0, -1):
+            arr[low], arr[low + end] = arr[low + end], arr[low]
+            sift_down(0, end)
+    
+    n = len(arr)
+    if n < 2:
+        return arr
+    
+    max_depth = 2 * (n.bit_length() - 1)
+    stack = [(0, n - 1, max_depth)]
+    while stack:
+        low, high, depth = stack.pop()
         
-        # Place pivot in correct position
-        arr[i + 1], arr[high] = arr[high], arr[i + 1]
-        return i + 1
+        # Work on one range until it is small; its larger side waits on the stack
+        while high - low + 1 > INSERTION_SORT_THRESHOLD:
+            if depth == 0:
+                # Too many uneven partitions: finish this range in guaranteed O(n log n)
+                heapsort(arr, low, high)
+                break
+            depth -= 1
+            
+            pivot = arr[choose_pivot(arr, low, high)]
+            lt, gt = partition_three_way(arr, low, high, pivot)
+            
+            if lt - low < high - gt:
+                stack.append((gt + 1, high, depth))
+                high = lt - 1
+            else:
+                stack.append((low, lt - 1, depth))
+                low = gt + 1
+        else:
+            insertion_sort(arr, low, high)
     
-    # Start the sorting process
-    _quicksort(arr, 0, len(arr) - 1)
+    return arr
+
+# Below this many elements a single process is faster than paying for a pool
+PARALLEL_THRESHOLD = 100_000
+
+# Splitter candidates drawn per bucket; more samples give more even buckets
+OVERSAMPLING = 32
+
+# Shared-memory segments attached by parallel_sort workers, typed views of them,
+# and the engine each worker sorts its chunks with
+_sort_segments = None
+_sort_views = None
+_sort_engine = None
+
+
+def _set_sort_engine(engine):
+    """Pool initializer: hand a parallel_sort worker its engine once"""
+    global _sort_engine
+    _sort_engine = engine
+
+
+def _attach_sort_buffers(input_name, output_name, typecode, nbytes, engine):
+    """Attach a parallel_sort worker to the input and output buffers"""
+    global _sort_segments, _sort_views
+    _set_sort_engine(engine)
+    _sort_segments = (shared_memory.SharedMemory(name=input_name),
+                      shared_memory.SharedMemory(name=output_name))
+    # Segments may be rounded up to a page, so view only the data
+    _sort_views = tuple(segment.buf[:nbytes].cast(typecode) for segment in _sort_segments)
+
+
+def _sort_chunk(task):
+    """Phase 1: sort one chunk of the input in place and cut it at the splitters"""
+    low, high, splitters = task
+    view = _sort_views[0]
+    chunk = _sort_list(view[low:high].tolist(), _sort_engine)
+    view[low:high] = array(view.format, chunk)
+    
+    # A run of r equal splitters (duplicate-heavy data) spreads the chunk's
+    # copies of that value evenly over the r + 1 buckets it borders
+    cuts = []
+    for splitter, run in groupby(splitters):
+        run = len(list(run))
+        first = bisect_left(chunk, splitter)
+        equal = bisect_right(chunk, splitter, first) - first
+        cuts.extend(low + first + equal * k // (run + 1) for k in range(1, run + 1))
+    return cuts
+
+
+def _merge_bucket(task):
+    """Phase 2: merge one bucket's sorted runs from every chunk into the output"""
+    segments, offset = task
+    input_view, output_view = _sort_views
+    values = []
+    for low, high in segments:
+        values.extend(input_view[low:high].tolist())
+    # Timsort merges the concatenated sorted runs in O(n log k)
+    values.sort()
+    output_view[offset:offset + len(values)] = array(output_view.format, values)
+
+
+def _sort_list(values, engine=None):
+    """Sort a list in place with the engine (list.sort by default) and return it"""
+    if engine is None:
+        values.sort()
+    else:
+        engine(values)
+    return values
+
+
+def _sort_pickled_chunk(values):
+    """Sort one pickled chunk with the worker's engine"""
+    return _sort_list(values, _sort_engine)
+
+
+def _numeric_typecode(arr):
+    """'q' for all-int data fitting in 64 bits, 'd' for all-float data, else None"""
+    if isinstance(arr, array):
+        return arr.typecode
+    types = set(map(type, arr))
+    if types == {float}:
+        return 'd'
+    if types == {int} and -(1 << 63) <= min(arr) and max(arr) < (1 << 63):
+        return 'q'
+    return None
+
+
+def parallel_sort(arr, workers=None, engine=None):
+    """
+    Parallel Sample Sort across CPU cores
+    
+    Splits the work between a process pool in two phases:
+    1. Splitters are sampled from the input, which is cut into one contiguous
+       chunk per worker; each worker sorts its chunk and finds where the
+       splitters fall in it
+    2. Each worker gathers one splitter-delimited bucket from every sorted
+       chunk, merges the runs and writes them to their final position
+    
+    Numeric data (all ints fitting in 64 bits, all floats, or an array.array)
+    is passed through shared-memory buffers, so only chunk bounds and
+    splitters are pickled. Other data falls back to sorting pickled chunks
+    and merging them in the parent.
+    
+    Args:
+        arr (list or array.array): Values to sort in place
+        workers (int): Number of processes (defaults to the CPU count)
+        engine (callable): In-memory sort applied to each chunk in place, e.g.
+            introsort; None uses list.sort. It is handed to each worker once by
+            the pool initializer, so it must be picklable unless workers are forked
+    
+    Time Complexity: O((n log n) / workers) per worker plus O(n) copying
+    
+    Characteristics:
+    - In-place sorting (modifies and returns the original sequence)
+    - Unstable sort across chunks
+    - Falls back to a single-process sort below PARALLEL_THRESHOLD elements
+    """
+    workers = workers or os.cpu_count() or 1
+    n = len(arr)
+    if workers == 1 or n < PARALLEL_THRESHOLD:
+        if isinstance(arr, array):
+            arr[:] = array(arr.typecode, _sort_list(arr.tolist(), engine))
+        else:
+            _sort_list(arr, engine)
+        return arr
+    
+    context = multiprocessing.get_context(
+        'fork' if 'fork' in multiprocessing.get_all_start_methods() else None)
+    chunk_size = -(-n // workers)
+    bounds = [(low, min(low + chunk_size, n)) for low in range(0, n, chunk_size)]
+    
+    typecode = _numeric_typecode(arr)
+    if typecode is None:
+        # Pickled fallback: sort chunks in the pool, merge the runs with Timsort
+        with context.Pool(workers, initializer=_set_sort_engine, initargs=(engine,)) as pool:
+            chunks = pool.map(_sort_pickled_chunk, [arr[low:high] for low, high in bounds])
+        merged = [value for chunk in chunks for value in chunk]
+        merged.sort()
+        arr[:] = merged
+        return arr
+    
+    # workers - 1 splitters taken evenly from a sorted random sample
+    sample = sorted(random.sample(range(n), min(n, workers * OVERSAMPLING)))
+    sample = sorted(arr[i] for i in sample)
+    step = len(sample) / workers
+    splitters = [sample[int(step * k)] for k in range(1, workers)]
+    
+    data = arr if isinstance(arr, array) else array(typecode, arr)
+    nbytes = len(data) * data.itemsize
+    input_segment = shared_memory.SharedMemory(create=True, size=nbytes)
+    output_segment = shared_memory.SharedMemory(create=True, size=nbytes)
+    try:
+        input_segment.buf[:nbytes] = memoryview(data).cast('B')
+        initargs = (input_segment.name, output_segment.name, typecode, nbytes, engine)
+        with context.Pool(workers, initializer=_attach_sort_buffers, initargs=initargs) as pool:
+            cuts = pool.map(_sort_chunk, [(low, high, splitters) for low, high in bounds])
+            
+            # Bucket j of chunk c spans cuts[c][j - 1]..cuts[c][j]
+            tasks = []
+            offset = 0
+            for j in range(workers):
+                segments = []
+                for (low, high), chunk_cuts in zip(bounds, cuts):
+                    start = low if j == 0 else chunk_cuts[j - 1]
+                    stop = high if j == workers - 1 else chunk_cuts[j]
+                    if start < stop:
+                        segments.append((start, stop))
+                tasks.append((segments, offset))
+                offset += sum(stop - start for start, stop in segments)
+            pool.map(_merge_bucket, tasks)
+        
+        result = array(typecode)
+        result.frombytes(output_segment.buf[:nbytes])
+        arr[:] = result if isinstance(arr, array) else result.tolist()
+    finally:
+        for segment in (input_segment, output_segment):
+            segment.close()
+            segment.unlink()
     return arr
 
 
@@ -64,6 +398,9 @@ if __name__ == "__main__":
     sorted_array = quicksort(test_array.copy())
     print("QuickSorted array:", sorted_array)
     
+    print("Introsorted array:", introsort(test_array.copy()))
+    print("Parallel-sorted array:", parallel_sort(test_array.copy()))
+    
     # Performance comparison with BubbleSort
     print("\n--- QuickSort vs BubbleSort Comparison ---")
     print("QuickSort Advantages:")
@@ -75,3 +412,4 @@ if __name__ == "__main__":
     print("- Worst-case performance can be O(n²)")
     print("- Not stable (may change order of equal elements)")
     print("- Recursive implementation can cause stack overflow for very large arrays")
+    print("  (introsort() avoids the worst case and the recursion: O(n log n) with an explicit stack)")
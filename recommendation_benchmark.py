@@ -0,0 +1,253 @@
+"""
+Scaling benchmark for the explainable recommendation system.
+
+Times fit, _calculate_similarities and recommend_for_user (p50/p95/p99) on
+generated workloads of increasing size, records peak memory, and writes the
+results as JSON so runs can be compared for regressions.
+
+Usage:
+    python recommendation_benchmark.py --output run.json
+    python recommendation_benchmark.py --scale 1000,1000,10000 --backend numpy
+    python recommendation_benchmark.py --output new.json --compare run.json
+"""
+
+import argparse
+import gc
+import json
+import math
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+from simplified_recommendation_system import (
+    SimpleExplainableRecommendationSystem,
+    generate_sample_data,
+    np
+)
+
+# (users, items, interactions), from 10^3 up to 10^6
+DEFAULT_SCALES = (
+    (1_000, 1_000, 10_000),
+    (10_000, 10_000, 100_000),
+    (100_000, 100_000, 1_000_000),
+    (1_000_000, 1_000_000, 1_000_000)
+)
+
+TIMING_KEYS = ('fit_seconds', 'similarity_seconds', 'recommend_p50', 'recommend_p95', 'recommend_p99')
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(len(sorted_values) * fraction))
+    return sorted_values[rank - 1]
+
+
+def _timed(func, *args):
+    """Run func with the garbage collector paused and return elapsed seconds"""
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        func(*args)
+        return time.perf_counter() - start
+    finally:
+        gc.enable()
+
+
+def _peak_memory(func, *args):
+    """Peak bytes traced by tracemalloc while running func"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def benchmark_scale(num_users, num_items, num_interactions, distribution='zipf',
+                    zipf_exponent=1.0, queries=200, seed=0, measure_memory=True, **model_options):
+    """Benchmark one workload size and return a JSON-serialisable result
+
+    Args:
+        num_users, num_items, num_interactions (int): Workload size
+        distribution (str): Passed through to generate_sample_data
+        zipf_exponent (float): Skew of the 'zipf' distribution
+        queries (int): Number of recommend_for_user calls to sample latency from
+        seed (int): Seed for the data and the queried users
+        measure_memory (bool): Re-run fit under tracemalloc to record peak memory
+        **model_options: Keyword arguments for SimpleExplainableRecommendationSystem
+    """
+    if queries < 1:
+        raise ValueError("queries must be at least 1")
+    data = generate_sample_data(num_users, num_items, num_interactions,
+                                distribution=distribution, zipf_exponent=zipf_exponent, seed=seed)
+
+    model = SimpleExplainableRecommendationSystem(**model_options)
+    fit_seconds = _timed(model.fit, data)
+    similarity_seconds = _timed(model._calculate_similarities)
+
+    # Query users the way traffic arrives: proportionally to their activity
+    rng = random.Random(seed)
+    query_users = [rng.choice(data)[0] for _ in range(queries)]
+    latencies = []
+    for user_id in query_users:
+        latencies.append(_timed(model.recommend_for_user, user_id))
+    latencies.sort()
+
+    result = {
+        'users': num_users,
+        'items': num_items,
+        'interactions': num_interactions,
+        'distinct_users': len(model.users),
+        'distinct_items': len(model.items),
+        'distribution': distribution,
+        'fit_seconds': fit_seconds,
+        'similarity_seconds': similarity_seconds,
+        'recommend_queries': len(latencies),
+        'recommend_mean': sum(latencies) / len(latencies),
+        'recommend_p50': percentile(latencies, 0.50),
+        'recommend_p95': percentile(latencies, 0.95),
+        'recommend_p99': percentile(latencies, 0.99),
+        'peak_memory_bytes': None
+    }
+
+    if measure_memory:
+        del model
+        result['peak_memory_bytes'] = _peak_memory(
+            SimpleExplainableRecommendationSystem(**model_options).fit, data)
+
+    return result
+
+
+def run_benchmarks(scales=DEFAULT_SCALES, budget=None, **options):
+    """Benchmark each scale in order and return the full JSON report
+
+    Once a scale takes longer than budget seconds to fit, the larger scales
+    are recorded as skipped instead of being run.
+    """
+    model_options = {key: options[key] for key in
+                     ('mode', 'backend', 'approximate', 'max_neighbors') if key in options}
+    report = {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'numpy': np.__version__ if np is not None else None,
+        'options': options,
+        'results': []
+    }
+
+    over_budget = False
+    for num_users, num_items, num_interactions in scales:
+        if over_budget:
+            report['results'].append({'users': num_users, 'items': num_items,
+                                      'interactions': num_interactions, 'skipped': True})
+            continue
+
+        result = benchmark_scale(num_users, num_items, num_interactions,
+                                 distribution=options.get('distribution', 'zipf'),
+                                 zipf_exponent=options.get('zipf_exponent', 1.0),
+                                 queries=options.get('queries', 200),
+                                 seed=options.get('seed', 0),
+                                 measure_memory=options.get('measure_memory', True),
+                                 **model_options)
+        report['results'].append(result)
+        print(f"{num_users}x{num_items}, {num_interactions} interactions: "
+              f"fit {result['fit_seconds']:.3f}s, p95 {result['recommend_p95'] * 1000:.2f}ms",
+              file=sys.stderr)
+
+        if budget is not None and result['fit_seconds'] > budget:
+            over_budget = True
+
+    return report
+
+
+def compare_reports(baseline, current, tolerance=0.10):
+    """List timing regressions of current against baseline
+
+    Results are matched by (users, items, interactions). A metric regresses
+    when it is more than tolerance (a fraction) slower than the baseline.
+    """
+    def key(result):
+        return (result['users'], result['items'], result['interactions'])
+
+    baseline_results = {key(result): result for result in baseline['results'] if not result.get('skipped')}
+    regressions = []
+    for result in current['results']:
+        before = baseline_results.get(key(result))
+        if before is None or result.get('skipped'):
+            continue
+        for metric in TIMING_KEYS:
+            if before.get(metric) and result.get(metric) is not None:
+                ratio = result[metric] / before[metric]
+                if ratio > 1 + tolerance:
+                    regressions.append({'scale': list(key(result)), 'metric': metric,
+                                        'baseline': before[metric], 'current': result[metric],
+                                        'ratio': ratio})
+    return regressions
+
+
+def _parse_scale(text):
+    """Parse a users,items,interactions triple"""
+    try:
+        num_users, num_items, num_interactions = (int(part) for part in text.split(','))
+    except ValueError:
+        raise argparse.ArgumentTypeError("scale must be users,items,interactions")
+    return num_users, num_items, num_interactions
+
+
+def main(argv=None):
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(description="Benchmark the recommender at increasing scale")
+    parser.add_argument('--scale', type=_parse_scale, action='append',
+                        help="users,items,interactions (repeatable; defaults to 10^3..10^6)")
+    parser.add_argument('--distribution', choices=('uniform', 'zipf'), default='zipf')
+    parser.add_argument('--zipf-exponent', type=float, default=1.0)
+    parser.add_argument('--mode', choices=('user', 'item'), default='user')
+    parser.add_argument('--backend', choices=('python', 'numpy'), default='python')
+    parser.add_argument('--approximate', action='store_true')
+    parser.add_argument('--max-neighbors', type=int)
+    parser.add_argument('--queries', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--no-memory', action='store_true', help="skip the tracemalloc pass")
+    parser.add_argument('--budget', type=float, default=600.0,
+                        help="skip larger scales once fit takes longer than this many seconds")
+    parser.add_argument('--output', help="write the JSON report here instead of stdout")
+    parser.add_argument('--compare', help="baseline JSON report to check for regressions")
+    parser.add_argument('--tolerance', type=float, default=0.10)
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(
+        scales=args.scale or DEFAULT_SCALES,
+        budget=args.budget,
+        distribution=args.distribution,
+        zipf_exponent=args.zipf_exponent,
+        mode=args.mode,
+        backend=args.backend,
+        approximate=args.approximate,
+        max_neighbors=args.max_neighbors,
+        queries=args.queries,
+        seed=args.seed,
+        measure_memory=not args.no_memory
+    )
+
+    if args.compare:
+        with open(args.compare) as f:
+            report['regressions'] = compare_reports(json.load(f), report, args.tolerance)
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
+
+    return 1 if report.get('regressions') else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
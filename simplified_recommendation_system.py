@@ -3,54 +3,1574 @@ Simplified Recommendation System with Explainable AI
 Uses only built-in Python libraries to avoid dependency issues
 """
 
+import argparse
+import asyncio
+import csv
+import functools
+import gc
+import heapq
+import json
 import math
+import mmap as mmap_module
+import multiprocessing
+import os
 import random
-from collections import defaultdict
+import sys
+import tempfile
+import time
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict, defaultdict, namedtuple
+from collections.abc import Mapping, MutableMapping, Set
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import compress, islice
+from numbers import Real
+from multiprocessing import shared_memory
+from urllib.parse import parse_qs, urlsplit
 
-class SimpleExplainableRecommendationSystem:
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the pure-Python engine is used without it
+    np = None
+
+# Compressed sparse row view of the user-item matrix (row_ids/col_ids map indices back to IDs)
+CSRMatrix = namedtuple('CSRMatrix', ['indptr', 'indices', 'data', 'row_ids', 'col_ids'])
+
+# Fitted model used by pool workers; set before forking so children share it copy-on-write
+_worker_model = None
+
+def _init_worker(model=None):
+    """Install the model in a pool worker (only needed when workers are spawned)"""
+    global _worker_model
+    if model is not None:
+        _worker_model = model
+
+def _recommend_chunk(task):
+    """Score one chunk of users inside a pool worker"""
+    user_ids, top_n, explain = task
+    return [(user_id, _worker_model.recommend_for_user(user_id, top_n, explain))
+            for user_id in user_ids]
+
+# Shared-memory rating arrays attached by similarity workers: name -> cast memoryview,
+# plus the external IDs of users and items so results leave workers ready to use
+_shared_memory = None
+_shared_arrays = None
+_shared_ids = None
+
+# Arrays a similarity worker needs: both CSR orientations and both norm vectors
+SHARED_SIMILARITY_ARRAYS = ('user_offsets', 'user_items', 'user_ratings',
+                            'item_offsets', 'item_users', 'item_ratings',
+                            'user_norms', 'item_norms')
+
+def _init_similarity_worker(name, layout, user_ids, item_ids):
+    """Attach a similarity worker to the shared rating arrays"""
+    global _shared_memory, _shared_arrays, _shared_ids
+    _shared_ids = {'user_': user_ids, 'item_': item_ids}
+    _shared_memory = shared_memory.SharedMemory(name=name)
+    view = _shared_memory.buf
+    _shared_arrays = {array_name: view[offset:offset + size].cast(typecode)
+                      for array_name, (offset, size, typecode) in layout.items()}
+
+def _similarity_tile(task):
+    """Score the rows start..stop of one tile against every other row
+    
+    Rows are users (by_user) or items; the inverted index is the opposite
+    orientation. Returns ([(row ID, {neighbor ID: similarity}), ...], pairs
+    scored), each neighbor dict ranked and cut to max_neighbors.
+    """
+    start, stop, by_user, max_neighbors = task
+    if by_user:
+        prefix = 'user_'
+        offsets, columns, values = (_shared_arrays[name] for name in
+                                    ('user_offsets', 'user_items', 'user_ratings'))
+        column_offsets, column_rows, column_values = (_shared_arrays[name] for name in
+                                                      ('item_offsets', 'item_users', 'item_ratings'))
+    else:
+        prefix = 'item_'
+        offsets, columns, values = (_shared_arrays[name] for name in
+                                    ('item_offsets', 'item_users', 'item_ratings'))
+        column_offsets, column_rows, column_values = (_shared_arrays[name] for name in
+                                                      ('user_offsets', 'user_items', 'user_ratings'))
+    norms = _shared_arrays[prefix + 'norms']
+    ids = _shared_ids[prefix]
+    
+    results = []
+    pairs = 0
+    for row in range(start, stop):
+        lo, hi = offsets[row], offsets[row + 1]
+        if lo == hi:
+            continue  # Interned but without ratings
+        magnitude1 = norms[row]
+        if magnitude1 == 0:
+            results.append((ids[row], {}))
+            continue
+        
+        # Same accumulation order as _score_user, so ties rank identically
+        dot_products = defaultdict(int)
+        for column, rating1 in zip(columns[lo:hi], values[lo:hi]):
+            a, b = column_offsets[column], column_offsets[column + 1]
+            for other_row, rating2 in zip(column_rows[a:b], column_values[a:b]):
+                dot_products[other_row] += rating1 * rating2
+        dot_products.pop(row, None)
+        pairs += len(dot_products)
+        
+        neighbors = []
+        for other_row, dot_product in dot_products.items():
+            magnitude2 = norms[other_row]
+            if magnitude2 == 0:
+                continue
+            similarity = dot_product / (magnitude1 * magnitude2)
+            if similarity > 0:
+                neighbors.append((ids[other_row], similarity))
+        
+        if max_neighbors is None:
+            neighbors.sort(key=lambda x: x[1], reverse=True)
+        else:
+            neighbors = heapq.nlargest(max_neighbors, neighbors, key=lambda x: x[1])
+        results.append((ids[row], dict(neighbors)))
+    return results, pairs
+
+# Expanded (rating, co-rater) pairs a NumPy block materialises at once
+NUMPY_BLOCK_PAIRS = 1 << 22
+
+def _numpy_blocks(indptr, indices, col_ptr, block_size):
+    """Split the rows into blocks of at most block_size rows and, unless a
+    single row needs more, NUMPY_BLOCK_PAIRS expanded pairs"""
+    num_rows = len(indptr) - 1
+    pair_counts = col_ptr[indices + 1] - col_ptr[indices]
+    pairs_before = np.concatenate(([0], np.cumsum(pair_counts)))[indptr]
+    blocks = []
+    start = 0
+    while start < num_rows:
+        stop = int(np.searchsorted(pairs_before, pairs_before[start] + NUMPY_BLOCK_PAIRS,
+                                   side='right')) - 1
+        stop = max(start + 1, min(stop, start + block_size, num_rows))
+        blocks.append((start, stop))
+        start = stop
+    return blocks
+
+def _numpy_similarity_block(indptr, indices, data, norms, col_ptr, col_rows, col_data,
+                            start, stop, max_neighbors, count_pairs=False):
+    """Cosine similarities of rows start..stop against their co-raters with one sparse product
+    
+    indptr/indices/data are the row-major CSR arrays and col_ptr/col_rows/col_data
+    the column-major ones. Only pairs that share a rated column are ever
+    materialised, so the work follows the number of co-ratings, not rows².
+    Returns ([(row, neighbor indices, similarities), ...], pairs scored), each
+    ranked (ties in ascending neighbor index) and cut to max_neighbors; pairs
+    are only counted when count_pairs is set.
+    """
+    num_rows = len(indptr) - 1
+    lo, hi = indptr[start], indptr[stop]
+    local_rows = np.repeat(np.arange(stop - start), np.diff(indptr[start:stop + 1]))
+    items = indices[lo:hi]
+    ratings = data[lo:hi]
+    
+    # Expand every (rating, co-rater) pair of the block: dots = B @ M.T
+    counts = col_ptr[items + 1] - col_ptr[items]
+    total = int(counts.sum())
+    starts = np.repeat(col_ptr[items] - (np.cumsum(counts) - counts), counts)
+    positions = starts + np.arange(total)
+    others = col_rows[positions]
+    weights = np.repeat(ratings, counts) * col_data[positions]
+    flat = np.repeat(local_rows, counts) * num_rows + others
+    
+    # Sum the products per distinct (row, co-rater) key, in sorted key order.
+    # Blocks whose pairs would fill a good part of the dense block are summed
+    # densely; sparse ones only ever touch the keys that occur.
+    cells = (stop - start) * num_rows
+    if cells <= NUMPY_BLOCK_PAIRS and total >= cells // 4:
+        dots = np.bincount(flat, weights=weights, minlength=cells)
+        keys = np.flatnonzero(dots)
+        dots = dots[keys]
+    else:
+        keys, inverse = np.unique(flat, return_inverse=True)
+        dots = np.bincount(inverse.ravel(), weights=weights, minlength=len(keys))
+    rows, others = np.divmod(keys, num_rows)
+    not_self = others != rows + start
+    rows, others, dots = rows[not_self], others[not_self], dots[not_self]
+    pairs = int(np.count_nonzero(dots)) if count_pairs else 0
+    
+    # Cosine similarity, skipping zero-magnitude rows
+    denominators = norms[rows + start] * norms[others]
+    similarities = np.divide(dots, denominators, out=np.zeros_like(dots),
+                             where=denominators > 0)
+    
+    # Rank the positive similarities of every row at once: by row, then most
+    # similar first, ties in ascending neighbor index. The pairs arrive in key
+    # order, so two stable sorts keep the neighbor order among equal scores.
+    positive = similarities > 0
+    rows, others, similarities = rows[positive], others[positive], similarities[positive]
+    order = np.argsort(-similarities, kind='stable')
+    order = order[np.argsort(rows[order], kind='stable')]
+    rows, others, similarities = rows[order], others[order], similarities[order]
+    bounds = np.searchsorted(rows, np.arange(stop - start + 1))
+    if max_neighbors is not None:
+        top = np.arange(len(rows)) - bounds[rows] < max_neighbors
+        rows, others, similarities = rows[top], others[top], similarities[top]
+        bounds = np.searchsorted(rows, np.arange(stop - start + 1))
+    
+    results = []
+    for offset in range(stop - start):
+        if indptr[start + offset] == indptr[start + offset + 1]:
+            continue  # Interned row whose ratings were all removed
+        a, b = bounds[offset], bounds[offset + 1]
+        results.append((start + offset, others[a:b], similarities[a:b]))
+    return results, pairs
+
+def _numpy_similarity_tile(task):
+    """Score one block of users inside a pool worker with the NumPy kernel"""
+    start, stop, max_neighbors, count_pairs = task
+    arrays = _shared_arrays
+    rating_type = np.uint8 if arrays['user_ratings'].format == 'B' else np.float64
+    results, pairs = _numpy_similarity_block(
+        np.frombuffer(arrays['user_offsets'], dtype=np.int64),
+        np.frombuffer(arrays['user_items'], dtype=np.int32).astype(np.int64),
+        np.frombuffer(arrays['user_ratings'], dtype=rating_type).astype(np.float64),
+        np.frombuffer(arrays['user_norms'], dtype=np.float64),
+        np.frombuffer(arrays['item_offsets'], dtype=np.int64),
+        np.frombuffer(arrays['item_users'], dtype=np.int32).astype(np.int64),
+        np.frombuffer(arrays['item_ratings'], dtype=rating_type).astype(np.float64),
+        start, stop, max_neighbors, count_pairs)
+    ids = _shared_ids['user_']
+    return [(ids[row], dict(zip([ids[j] for j in positive.tolist()], similarities.tolist())))
+            for row, positive, similarities in results], pairs
+
+# Explanation templates; evidence is (source ID, similarity, rating)
+USER_EXPLANATION = "Similar user {source} rated this item {rating}/5 (similarity: {similarity:.2f})"
+ITEM_EXPLANATION = "Because you rated item {source} {rating}/5 (similarity: {similarity:.2f})"
+FALLBACK_EXPLANATION = "This item is popular among users with similar preferences"
+
+class Explanation(list):
+    """Explanation lines for one recommendation, plus the evidence behind them
+    
+    A plain list of strings, so results stay mutable and JSON-serialisable;
+    template and evidence keep the (source ID, similarity, rating) tuples the
+    lines were formatted from.
+    """
+    
+    def __init__(self, template, evidence):
+        lines = [template.format(source=source, similarity=similarity, rating=rating)
+                 for source, similarity, rating in evidence]
+        super().__init__(lines or [FALLBACK_EXPLANATION])
+        self.template = template
+        self.evidence = evidence
+    
+    def copy(self):
+        """An independent Explanation with the same lines and evidence"""
+        explanation = Explanation.__new__(Explanation)
+        explanation.extend(self)
+        explanation.template = self.template
+        explanation.evidence = list(self.evidence)
+        return explanation
+
+def _copy_recommendations(result):
+    """A recommend_for_user result the caller can modify without touching the cache"""
+    if isinstance(result, tuple):
+        return [], result[1]
+    return [{key: value.copy() if key == 'explanation' else value for key, value in rec.items()}
+            for rec in result]
+
+# Saved model layout: magic, 8-byte header length, JSON header, then 8-byte aligned arrays
+MODEL_MAGIC = b'SERSMDL2'
+
+# RatingStore arrays written by save(); the norms are copied on load, the rest can be mapped
+RATING_STORE_NORMS = ('user_squared_norms', 'user_norms', 'item_squared_norms', 'item_norms')
+RATING_STORE_ARRAYS = ('user_offsets', 'user_items', 'user_ratings',
+                       'item_offsets', 'item_users', 'item_ratings') + RATING_STORE_NORMS
+
+class _CSRMapping(MutableMapping):
+    """Dict-of-dicts view over flat CSR arrays (e.g. memory-mapped from a saved model)
+    
+    Rows are decoded into small dicts on access and never cached, so reading a
+    row touches only its slice of the arrays. Rows that are written or deleted
+    are kept in an in-memory overlay on top of the read-only arrays.
+    """
+    
+    def __init__(self, row_ids, indptr, columns, values, col_ids):
+        self._row_index = {row_id: i for i, row_id in enumerate(row_ids)}
+        self._indptr = indptr
+        self._columns = columns
+        self._values = values
+        self._col_ids = col_ids
+        self._overlay = {}
+        self._deleted = set()
+    
+    def __getitem__(self, row_id):
+        if row_id in self._overlay:
+            return self._overlay[row_id]
+        if row_id in self._deleted or row_id not in self._row_index:
+            raise KeyError(row_id)
+        
+        i = self._row_index[row_id]
+        lo, hi = self._indptr[i], self._indptr[i + 1]
+        col_ids = self._col_ids
+        return dict(zip([col_ids[j] for j in self._columns[lo:hi].tolist()],
+                        self._values[lo:hi].tolist()))
+    
+    def __setitem__(self, row_id, row):
+        self._overlay[row_id] = row
+        self._deleted.discard(row_id)
+    
+    def __delitem__(self, row_id):
+        if row_id in self._overlay:
+            del self._overlay[row_id]
+            if row_id in self._row_index:
+                self._deleted.add(row_id)
+        elif row_id in self._row_index and row_id not in self._deleted:
+            self._deleted.add(row_id)
+        else:
+            raise KeyError(row_id)
+    
+    def __contains__(self, row_id):
+        if row_id in self._overlay:
+            return True
+        return row_id in self._row_index and row_id not in self._deleted
+    
+    def __iter__(self):
+        for row_id in self._row_index:
+            if row_id not in self._deleted and row_id not in self._overlay:
+                yield row_id
+        yield from self._overlay
+    
+    def __len__(self):
+        base = sum(1 for row_id in self._deleted if row_id not in self._overlay)
+        extra = sum(1 for row_id in self._overlay if row_id not in self._row_index)
+        return len(self._row_index) - base + extra
+    
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        for name in ('_indptr', '_columns', '_values'):
+            state[name] = _owned(state[name])
+        return state
+
+def _typecode(values):
+    """Element type of an array.array or a cast memoryview"""
+    return values.typecode if isinstance(values, array) else values.format
+
+def _owned(values):
+    """values as an array.array; memoryviews of a mapped file cannot be pickled"""
+    if isinstance(values, array):
+        return values
+    copy = array(values.format)
+    copy.frombytes(values.cast('B'))
+    return copy
+
+def _file_identity(path):
+    """(device, inode, size, mtime) of a file, or None if it cannot be read"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+class _InternTable:
+    """Maps external IDs to dense integer indices; indices are never reused"""
+    
+    def __init__(self, ids=()):
+        self.ids = list(ids)
+        self.index = {external_id: i for i, external_id in enumerate(self.ids)}
+    
+    def intern(self, external_id):
+        """Return the index of an ID, assigning the next free one if it is new"""
+        i = self.index.get(external_id)
+        if i is None:
+            i = len(self.ids)
+            self.index[external_id] = i
+            self.ids.append(external_id)
+        return i
+    
+    def __len__(self):
+        return len(self.ids)
+
+def _check_rating(user_id, item_id, rating):
+    """Raise ValueError unless rating is a real number"""
+    if not isinstance(rating, Real):
+        raise ValueError(f"Rating for user {user_id!r} and item {item_id!r} must be a number, "
+                         f"not {rating!r}")
+
+class RatingStore:
+    """Interned, array-backed rating matrix kept in user-major and item-major CSR form
+    
+    Compacted ratings live in parallel flat arrays: per-row offsets, the column
+    index and the rating (uint8 while every rating is an integer from 0 to 255,
+    float64 otherwise), about 10 bytes per rating for both orientations.
+    Bulk loads are appended to flat (user, item, rating) columns by extend()
+    and sorted into the arrays once by compact(). Rows changed one rating at a
+    time since the last compaction are kept as small dicts that shadow their
+    slice of the arrays until compact() folds them back in.
+    """
+    
     def __init__(self):
-        self.user_item_matrix = {}
+        self.users = _InternTable()
+        self.items = _InternTable()
+        self.user_offsets = array('q', [0])
+        self.user_items = array('i')
+        self.user_ratings = array('B')
+        self.item_offsets = array('q', [0])
+        self.item_users = array('i')
+        self.item_ratings = array('B')
+        self.user_squared_norms = array('d')
+        self.user_norms = array('d')
+        self.item_squared_norms = array('d')
+        self.item_norms = array('d')
+        self.live_users = 0
+        self.live_items = 0
+        self._user_overlay = {}
+        self._item_overlay = {}
+        self._overlay_ratings = 0
+        self._pending_users = array('i')
+        self._pending_items = array('i')
+        self._pending_ratings = array('B')
+    
+    @staticmethod
+    def _slice(offsets, columns, values, overlay, row):
+        """(column, rating) pairs of one row, from the overlay or the arrays"""
+        if row in overlay:
+            return overlay[row].items()
+        if row + 1 >= len(offsets):
+            return ()
+        lo, hi = offsets[row], offsets[row + 1]
+        return zip(columns[lo:hi], values[lo:hi])
+    
+    def user_row(self, u):
+        """(item index, rating) pairs for user index u"""
+        return self._slice(self.user_offsets, self.user_items, self.user_ratings,
+                           self._user_overlay, u)
+    
+    def item_column(self, i):
+        """(user index, rating) pairs for item index i"""
+        return self._slice(self.item_offsets, self.item_users, self.item_ratings,
+                           self._item_overlay, i)
+    
+    def user_degree(self, u):
+        """Number of ratings by user index u"""
+        if u in self._user_overlay:
+            return len(self._user_overlay[u])
+        if u + 1 >= len(self.user_offsets):
+            return 0
+        return self.user_offsets[u + 1] - self.user_offsets[u]
+    
+    def item_degree(self, i):
+        """Number of ratings of item index i"""
+        if i in self._item_overlay:
+            return len(self._item_overlay[i])
+        if i + 1 >= len(self.item_offsets):
+            return 0
+        return self.item_offsets[i + 1] - self.item_offsets[i]
+    
+    def _user_row_for_update(self, u):
+        row = self._user_overlay.get(u)
+        if row is None:
+            row = self._user_overlay[u] = dict(self.user_row(u))
+            self._overlay_ratings += len(row)
+        return row
+    
+    def _item_column_for_update(self, i):
+        column = self._item_overlay.get(i)
+        if column is None:
+            column = self._item_overlay[i] = dict(self.item_column(i))
+            self._overlay_ratings += len(column)
+        return column
+    
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        for name in RATING_STORE_ARRAYS:
+            state[name] = _owned(state[name])
+        return state
+    
+    def extend(self, interactions):
+        """Queue (user_id, item_id, rating) triples for the next compact()
+        
+        Each rating costs about 9 bytes in three flat columns; nothing is
+        indexed until compact() sorts them into the CSR arrays in one pass.
+        Queued ratings are not visible to reads before then. A rating that is
+        not a number raises ValueError; the triples before it stay queued.
+        """
+        intern_user = self.users.intern
+        intern_item = self.items.intern
+        append_user = self._pending_users.append
+        append_item = self._pending_items.append
+        append_rating = self._pending_ratings.append
+        for user_id, item_id, rating in interactions:
+            u, i = intern_user(user_id), intern_item(item_id)
+            # The rating goes in first, so a bad one leaves the columns in step
+            try:
+                append_rating(rating)
+            except (TypeError, OverflowError):
+                _check_rating(user_id, item_id, rating)
+                # Not an integer from 0 to 255: switch the column to float64
+                self._pending_ratings = array('d', self._pending_ratings)
+                append_rating = self._pending_ratings.append
+                append_rating(rating)
+            append_user(u)
+            append_item(i)
+    
+    def discard_pending(self):
+        """Drop the triples queued by extend() since the last compact()"""
+        self._pending_users, self._pending_items = array('i'), array('i')
+        self._pending_ratings = array('B')
+    
+    def set(self, user_id, item_id, rating):
+        """Store a rating, returning the previous one (or None)"""
+        _check_rating(user_id, item_id, rating)
+        if self._pending_users:
+            self.compact()
+        u = self.users.intern(user_id)
+        i = self.items.intern(item_id)
+        while len(self.user_norms) < len(self.users):
+            self.user_squared_norms.append(0.0)
+            self.user_norms.append(0.0)
+        while len(self.item_norms) < len(self.items):
+            self.item_squared_norms.append(0.0)
+            self.item_norms.append(0.0)
+        
+        row = self._user_row_for_update(u)
+        column = self._item_column_for_update(i)
+        old_rating = row.get(i)
+        row[i] = rating
+        column[u] = rating
+        if old_rating is None:
+            self._overlay_ratings += 2
+            self.live_users += len(row) == 1
+            self.live_items += len(column) == 1
+        
+        # Keep the norms current without rescanning the row or column
+        delta = rating * rating - (old_rating or 0) ** 2
+        self.user_squared_norms[u] += delta
+        self.user_norms[u] = math.sqrt(self.user_squared_norms[u])
+        self.item_squared_norms[i] += delta
+        self.item_norms[i] = math.sqrt(self.item_squared_norms[i])
+        return old_rating
+    
+    def remove(self, user_id, item_id):
+        """Remove a rating and return it; raises KeyError if it does not exist"""
+        if self._pending_users:
+            self.compact()
+        u = self.users.index.get(user_id)
+        i = self.items.index.get(item_id)
+        if u is None or i is None or not any(j == i for j, _ in self.user_row(u)):
+            raise KeyError(f"User {user_id} has not rated item {item_id}")
+        
+        row = self._user_row_for_update(u)
+        column = self._item_column_for_update(i)
+        rating = row.pop(i)
+        del column[u]
+        self._overlay_ratings -= 2
+        
+        # Rows that become empty are reset exactly rather than left with rounding residue
+        for squared_norms, norms, index, remaining in (
+                (self.user_squared_norms, self.user_norms, u, row),
+                (self.item_squared_norms, self.item_norms, i, column)):
+            squared_norms[index] = squared_norms[index] - rating * rating if remaining else 0.0
+            norms[index] = math.sqrt(squared_norms[index])
+        self.live_users -= not row
+        self.live_items -= not column
+        return rating
+    
+    def needs_compaction(self):
+        """True once the overlay copies (rows and columns) hold more than an eighth
+        of the compacted ratings of both orientations"""
+        return self._overlay_ratings > max(4096, len(self.user_items) // 4)
+    
+    def compact(self):
+        """Fold the overlay rows and any queued ratings into freshly built flat arrays"""
+        self._fold_overlay()
+        if self._pending_users:
+            self._fold_pending()
+    
+    def _fold_overlay(self):
+        """Fold the overlay rows back into freshly built flat arrays"""
+        if not self._user_overlay and not self._item_overlay:
+            return
+        
+        # Stay uint8 only while every rating fits
+        typecode = _typecode(self.user_ratings)
+        if typecode == 'B' and not all(
+                isinstance(rating, int) and 0 <= rating <= 255
+                for row in self._user_overlay.values() for rating in row.values()):
+            typecode = 'd'
+        
+        self.user_offsets, self.user_items, self.user_ratings = self._merge(
+            self.user_offsets, self.user_items, self.user_ratings,
+            self._user_overlay, len(self.users), typecode)
+        self.item_offsets, self.item_users, self.item_ratings = self._merge(
+            self.item_offsets, self.item_users, self.item_ratings,
+            self._item_overlay, len(self.items), typecode)
+        self._user_overlay = {}
+        self._item_overlay = {}
+        self._overlay_ratings = 0
+    
+    def _fold_pending(self):
+        """Sort the queued columns (after the compacted ratings) into new CSR arrays"""
+        users, items, ratings = self._pending_users, self._pending_items, self._pending_ratings
+        self.discard_pending()
+        typecode = 'd' if 'd' in (_typecode(self.user_ratings), ratings.typecode) else 'B'
+        if ratings.typecode != typecode:
+            ratings = array(typecode, ratings)
+        
+        # Compacted ratings go first, so queued ratings for the same pair replace them
+        if len(self.user_items):
+            existing_users = array('i')
+            for u in range(len(self.user_offsets) - 1):
+                existing_users.extend(array('i', [u]) * (self.user_offsets[u + 1] - self.user_offsets[u]))
+            users = existing_users + users
+            items = array('i', self.user_items) + items
+            ratings = array(typecode, self.user_ratings) + ratings
+        
+        num_users, num_items, n = len(self.users), len(self.items), len(users)
+        
+        # Counting sort by user; each row keeps the input order
+        user_offsets = self._counts_to_offsets(users, num_users)
+        next_slot = user_offsets[:-1]
+        order = array('i' if n < 1 << 31 else 'q', [0]) * n
+        for k, u in enumerate(users):
+            slot = next_slot[u]
+            order[slot] = k
+            next_slot[u] = slot + 1
+        del next_slot
+        
+        # Rows, without repeated (user, item) pairs: the last rating wins, at the first position
+        kept = array('B', [1]) * n
+        row_starts = user_offsets[:]
+        user_items = array('i')
+        user_ratings = array(typecode)
+        for u in range(num_users):
+            positions = order[row_starts[u]:row_starts[u + 1]]
+            row_items = [items[k] for k in positions]
+            if len(set(row_items)) < len(row_items):
+                first = {}
+                for k, i in zip(positions, row_items):
+                    if i in first:
+                        kept[k] = 0
+                        ratings[first[i]] = ratings[k]
+                    else:
+                        first[i] = k
+                positions, row_items = list(first.values()), list(first)
+            user_items.extend(row_items)
+            user_ratings.extend([ratings[k] for k in positions])
+            user_offsets[u + 1] = len(user_items)
+        del order, row_starts
+        
+        # Counting sort of the kept ratings by item, in input order within each column
+        item_offsets = self._counts_to_offsets(compress(items, kept), num_items)
+        next_slot = item_offsets[:-1]
+        item_users = array('i', [0]) * len(user_items)
+        item_ratings = array(typecode, [0]) * len(user_items)
+        for u, i, rating in compress(zip(users, items, ratings), kept):
+            slot = next_slot[i]
+            item_users[slot] = u
+            item_ratings[slot] = rating
+            next_slot[i] = slot + 1
+        del users, items, ratings, kept, next_slot
+        
+        self.user_offsets, self.user_items, self.user_ratings = user_offsets, user_items, user_ratings
+        self.item_offsets, self.item_users, self.item_ratings = item_offsets, item_users, item_ratings
+        self.user_squared_norms, self.user_norms, self.live_users = self._norms(
+            user_offsets, user_ratings)
+        self.item_squared_norms, self.item_norms, self.live_items = self._norms(
+            item_offsets, item_ratings)
+    
+    @staticmethod
+    def _counts_to_offsets(indices, rows):
+        """CSR offsets for rows 0..rows - 1 from the row index of every entry"""
+        offsets = array('q', [0]) * (rows + 1)
+        for row in indices:
+            offsets[row + 1] += 1
+        for row in range(rows):
+            offsets[row + 1] += offsets[row]
+        return offsets
+    
+    @staticmethod
+    def _norms(offsets, values):
+        """Squared norms, norms and the number of non-empty rows"""
+        squared_norms = array('d')
+        live = 0
+        for row in range(len(offsets) - 1):
+            lo, hi = offsets[row], offsets[row + 1]
+            squared_norms.append(sum(value * value for value in values[lo:hi]))
+            live += lo < hi
+        return squared_norms, array('d', map(math.sqrt, squared_norms)), live
+    
+    @staticmethod
+    def _merge(offsets, columns, values, overlay, rows, typecode):
+        new_offsets = array('q', [0])
+        new_columns = array('i')
+        new_values = array(typecode)
+        same_type = _typecode(values) == typecode
+        for row in range(rows):
+            if row in overlay:
+                new_columns.extend(overlay[row].keys())
+                new_values.extend(overlay[row].values())
+            elif row + 1 < len(offsets):
+                lo, hi = offsets[row], offsets[row + 1]
+                new_columns.extend(columns[lo:hi])
+                new_values.extend(values[lo:hi] if same_type else values[lo:hi].tolist())
+            new_offsets.append(len(new_columns))
+        return new_offsets, new_columns, new_values
+
+class _RatingsView(Mapping):
+    """Read-only dict-of-dicts view of a RatingStore keyed by external IDs
+    
+    by_user=True gives user -> {item: rating} (the classic user_item_matrix);
+    by_user=False gives item -> {user: rating}.
+    """
+    
+    def __init__(self, store, by_user=True):
+        self._store = store
+        self._by_user = by_user
+    
+    def _tables(self):
+        store = self._store
+        if self._by_user:
+            return store.users, store.items, store.user_row, store.user_degree
+        return store.items, store.users, store.item_column, store.item_degree
+    
+    def __getitem__(self, key):
+        rows, columns, row, degree = self._tables()
+        index = rows.index.get(key)
+        if index is None or not degree(index):
+            raise KeyError(key)
+        column_ids = columns.ids
+        return {column_ids[j]: rating for j, rating in row(index)}
+    
+    def __contains__(self, key):
+        rows, _, _, degree = self._tables()
+        index = rows.index.get(key)
+        return index is not None and degree(index) > 0
+    
+    def __iter__(self):
+        rows, _, _, degree = self._tables()
+        for index, key in enumerate(rows.ids):
+            if degree(index):
+                yield key
+    
+    def __len__(self):
+        return self._store.live_users if self._by_user else self._store.live_items
+
+class _IdSetView(Set):
+    """Set-like view of the users (or items) that currently have ratings"""
+    
+    def __init__(self, store, by_user=True):
+        self._ratings = _RatingsView(store, by_user)
+    
+    @classmethod
+    def _from_iterable(cls, iterable):
+        return set(iterable)
+    
+    def __contains__(self, key):
+        return key in self._ratings
+    
+    def __iter__(self):
+        return iter(self._ratings)
+    
+    def __len__(self):
+        return len(self._ratings)
+
+class RecommendationCache:
+    """Bounded LRU cache with an optional TTL, invalidated when the model version changes"""
+    
+    MISSING = object()
+    
+    def __init__(self, maxsize=1024, ttl=None):
+        if maxsize < 1:
+            raise ValueError("maxsize must be a positive integer")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.version = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+        self._entries = OrderedDict()
+    
+    def get(self, key, version):
+        """Return the cached value, or MISSING if absent, expired or from an older model"""
+        if version != self.version:
+            if self._entries:
+                self.invalidations += 1
+            self._entries.clear()
+            self.version = version
+        
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return self.MISSING
+        
+        value, expires_at = entry
+        if expires_at is not None and time.monotonic() >= expires_at:
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return self.MISSING
+        
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+    
+    def put(self, key, value, version):
+        """Store a value computed against the given model version"""
+        if version != self.version:
+            self._entries.clear()
+            self.version = version
+        
+        expires_at = None if self.ttl is None else time.monotonic() + self.ttl
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+    
+    def clear(self):
+        """Drop every entry, keeping the counters"""
+        self._entries.clear()
+    
+    def stats(self):
+        """Return the cache counters as a dict"""
+        return {
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'invalidations': self.invalidations
+        }
+
+class Instrumentation:
+    """Opt-in phase timings, counters and latency histograms for a recommender
+    
+    Phases: 'build' (rating matrix), 'similarity', 'neighbors', 'scoring',
+    'explanation' (formatting the evidence gathered while scoring) and
+    'recommend' (a whole uncached recommend_for_user call).
+    
+    Hooks are callables invoked as hook(phase, seconds) after every timed
+    phase, e.g. to forward timings to a metrics agent; snapshot() returns
+    everything recorded so far for pull-style exporting.
+    """
+    
+    # Histogram bucket upper bounds in seconds; the last bucket is unbounded
+    BUCKET_BOUNDS = (0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025,
+                     0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+    
+    def __init__(self, hooks=()):
+        self.hooks = list(hooks)
+        self.timings = defaultdict(float)
+        self.calls = defaultdict(int)
+        self.counters = defaultdict(int)
+        self.histograms = {}
+    
+    def add_hook(self, hook):
+        """Call hook(phase, seconds) after every timed phase"""
+        self.hooks.append(hook)
+    
+    def record(self, phase, seconds):
+        """Add one timing to a phase's total and histogram"""
+        self.timings[phase] += seconds
+        self.calls[phase] += 1
+        histogram = self.histograms.get(phase)
+        if histogram is None:
+            histogram = self.histograms[phase] = [0] * (len(self.BUCKET_BOUNDS) + 1)
+        histogram[bisect_left(self.BUCKET_BOUNDS, seconds)] += 1
+        for hook in self.hooks:
+            hook(phase, seconds)
+    
+    def count(self, name, amount=1):
+        """Increment a counter"""
+        self.counters[name] += amount
+    
+    def reset(self):
+        """Drop everything recorded so far, keeping the hooks"""
+        self.timings.clear()
+        self.calls.clear()
+        self.counters.clear()
+        self.histograms.clear()
+    
+    def snapshot(self):
+        """Return the timings, counters and histograms as a JSON-ready dict"""
+        return {
+            'timings': {phase: {'seconds': seconds, 'calls': self.calls[phase]}
+                        for phase, seconds in list(self.timings.items())},
+            'counters': dict(self.counters),
+            'histograms': {phase: list(counts) for phase, counts in list(self.histograms.items())},
+            'bucket_bounds': list(self.BUCKET_BOUNDS)
+        }
+
+class SimpleExplainableRecommendationSystem:
+    def __init__(self, mode='user', backend='python', block_size=256, max_neighbors=None,
+                 approximate=False, lsh_tables=8, lsh_bits=8, lsh_seed=None,
+                 cache_size=None, cache_ttl=None, instrumentation=None,
+                 neighborhood_size=5, min_rating=3, fit_workers=None):
+        """
+        Args:
+            mode (str): 'user' recommends what similar users liked; 'item' precomputes
+                item neighborhoods and recommends items similar to the user's own
+            backend (str): 'python' for the pure-Python engine, or 'numpy' for the
+                vectorized CSR engine (falls back to 'python' when NumPy is missing);
+                only used for user-user similarities
+            block_size (int): Number of users scored per block by the NumPy engine
+            max_neighbors (int): Keep only this many most similar users per user, or
+                items per item in item mode (None keeps every positive similarity)
+            approximate (bool): Find similar users through a locality-sensitive
+                hashing index instead of scoring every pair at fit time
+            lsh_tables (int): Number of hash tables; more tables raise recall
+                and the number of candidates scored per lookup
+            lsh_bits (int): Hyperplanes per table; more bits mean smaller buckets,
+                so fewer candidates and lower recall
+            lsh_seed (int): Seed for the random hyperplanes
+            cache_size (int): Cache up to this many recommend_for_user results
+                (None disables the cache); every call gets its own copy of a cached result
+            cache_ttl (float): Seconds a cached result stays valid (None for no expiry)
+            instrumentation (Instrumentation): Records phase timings and counters
+                (None, the default, skips all bookkeeping)
+            neighborhood_size (int): Number of similar users consulted per recommendation
+            min_rating (float): Ratings below this never make an item a candidate
+                (user mode) or let a rated item vouch for its neighbors (item mode)
+            fit_workers (int): Compute exact similarities at fit time in tiles across
+                this many processes sharing the ratings (None or 1 stays in-process)
+        """
+        if mode not in ('user', 'item'):
+            raise ValueError("mode must be 'user' or 'item'")
+        if mode == 'item' and approximate:
+            raise ValueError("approximate neighbor search is only available in user mode")
+        if backend not in ('python', 'numpy'):
+            raise ValueError("backend must be 'python' or 'numpy'")
+        if max_neighbors is not None and max_neighbors < 1:
+            raise ValueError("max_neighbors must be a positive integer or None")
+        if fit_workers is not None and fit_workers < 1:
+            raise ValueError("fit_workers must be a positive integer or None")
+        if neighborhood_size < 1:
+            raise ValueError("neighborhood_size must be a positive integer")
+        if lsh_tables < 1 or not 1 <= lsh_bits <= 64:
+            raise ValueError("lsh_tables must be positive and lsh_bits between 1 and 64")
+        if backend == 'numpy' and np is None:
+            backend = 'python'
+        
+        self.mode = mode
+        self.backend = backend
+        self.block_size = block_size
+        self.max_neighbors = max_neighbors
+        self.approximate = approximate
+        self.lsh_tables = lsh_tables
+        self.lsh_bits = lsh_bits
+        self.lsh_seed = lsh_seed
+        self.neighborhood_size = neighborhood_size
+        self.min_rating = min_rating
+        self.fit_workers = fit_workers
+        self.lsh_buckets = [defaultdict(set) for _ in range(lsh_tables)]
+        self.user_signatures = {}
+        self.item_hyperplanes = {}
+        self._lsh_random = random.Random(lsh_seed)
+        self.store = RatingStore()
+        self.user_item_matrix = _RatingsView(self.store, by_user=True)
+        self.item_raters = _RatingsView(self.store, by_user=False)
+        self.users = _IdSetView(self.store, by_user=True)
+        self.items = _IdSetView(self.store, by_user=False)
+        self.user_item_csr = None
         self.user_similarities = {}
-        self.users = set()
-        self.items = set()
+        self.item_similarities = {}
+        self.model_version = 0
+        self.cache = None if cache_size is None else RecommendationCache(cache_size, cache_ttl)
+        self.instrumentation = instrumentation
+        self._index_stale = False
+        self._mapped_file = None
+        self._mapped_source = None
+    
+    def __getstate__(self):
+        """Pickle support, for spawned pool workers
         
+        A memory-mapped model unchanged since load() (and whose file is
+        unchanged too) pickles as its path, so each worker maps the same file
+        and shares its pages; anything set on it after load(), such as
+        instrumentation, is not carried over. Otherwise the mapped arrays are
+        copied into the pickle.
+        """
+        source = self._mapped_source
+        if source is not None:
+            path, identity, version = source
+            if version == self.model_version and _file_identity(path) == identity:
+                return {'_mapped_source': source}
+        state = self.__dict__.copy()
+        state['_mapped_file'] = None
+        state['_mapped_source'] = None
+        return state
+    
+    def __setstate__(self, state):
+        if '_mapped_file' not in state:
+            # Pickled as a path: map the file again
+            state = type(self).load(state['_mapped_source'][0], mmap=True).__dict__
+        self.__dict__.update(state)
+    
     def fit(self, interactions):
         """Fit the recommendation system on interaction data"""
-        # Create user-item matrix
-        for user_id, item_id, rating in interactions:
-            self.users.add(user_id)
-            self.items.add(item_id)
-            
-            if user_id not in self.user_item_matrix:
-                self.user_item_matrix[user_id] = {}
-            self.user_item_matrix[user_id][item_id] = rating
+        self._ensure_index()
+        metrics = self.instrumentation
+        if metrics is not None:
+            start = time.perf_counter()
+        
+        # Create user-item matrix: append to flat columns, then build the CSR arrays once
+        try:
+            self.store.extend(interactions)
+        except Exception:
+            self.store.discard_pending()
+            raise
+        self.store.compact()
+        if metrics is not None:
+            metrics.record('build', time.perf_counter() - start)
         
         # Calculate user similarities
         self._calculate_similarities()
+        self.model_version += 1
+    
+    def fit_from_file(self, path, format=None, chunk_size=100000, id_type=None, progress=None):
+        """Fit the recommendation system by streaming interactions from a CSV or JSONL file
+        
+        Rows are parsed lazily and appended to flat rating columns chunk by
+        chunk, so peak memory is about one chunk plus the rating arrays; the
+        interaction log is never materialized as a list. progress, if given,
+        is called with the number of interactions read after every chunk.
+        Returns the number of interactions read.
+        """
+        self._ensure_index()
+        metrics = self.instrumentation
+        if metrics is not None:
+            start = time.perf_counter()
+        
+        count = 0
+        interactions = read_interactions(path, format=format, id_type=id_type)
+        try:
+            while True:
+                chunk = list(islice(interactions, chunk_size))
+                if not chunk:
+                    break
+                self.store.extend(chunk)
+                count += len(chunk)
+                if progress is not None:
+                    progress(count)
+        except Exception:
+            # A bad row fails the whole file rather than leaving part of it queued
+            self.store.discard_pending()
+            raise
+        self.store.compact()
+        if metrics is not None:
+            metrics.record('build', time.perf_counter() - start)
+        
+        self._calculate_similarities()
+        self.model_version += 1
+        return count
+    
+    def partial_fit(self, interactions):
+        """Add or update ratings, refreshing only the similarities they affect"""
+        self._ensure_index()
+        # Check every rating first, so a bad one leaves the model untouched
+        interactions = list(interactions)
+        for user_id, item_id, rating in interactions:
+            _check_rating(user_id, item_id, rating)
+        
+        changed_users = set()
+        changed_items = set()
+        for user_id, item_id, rating in interactions:
+            self.store.set(user_id, item_id, rating)
+            changed_users.add(user_id)
+            changed_items.add(item_id)
+        
+        self._refresh_similarities(changed_users, changed_items)
+        if self.store.needs_compaction():
+            self.store.compact()
+        self.model_version += 1
+    
+    def remove_interaction(self, user_id, item_id):
+        """Remove a single rating, refreshing only the similarities it affects"""
+        self._ensure_index()
+        
+        # Former co-raters of the item lose (part of) their overlap with this user
+        former_raters = set(self.item_raters.get(item_id, ()))
+        
+        self.store.remove(user_id, item_id)
+        
+        # Users and items without ratings leave the model entirely
+        if item_id not in self.items:
+            self.item_similarities.pop(item_id, None)
+        if user_id not in self.users:
+            self.user_similarities.pop(user_id, None)
+        
+        self._refresh_similarities({user_id}, {item_id}, former_raters)
+        if self.store.needs_compaction():
+            self.store.compact()
+        self.model_version += 1
+    
+    def _ensure_index(self):
+        """Rebuild the LSH tables, which a loaded model does not store"""
+        if not self._index_stale:
+            return
+        self._index_stale = False
+        
+        if self.approximate:
+            for user_id in self.users:
+                self._hash_user(user_id)
+    
+    def _co_raters(self, user_id):
+        """IDs of every user who rated at least one item user_id rated"""
+        store = self.store
+        u = store.users.index.get(user_id)
+        if u is None:
+            return set()
+        
+        co_raters = set()
+        for i, _ in store.user_row(u):
+            co_raters.update(v for v, _ in store.item_column(i))
+        return {store.users.ids[v] for v in co_raters}
+    
+    def _refresh_similarities(self, changed_users, changed_items, extra_users=()):
+        """Update neighbor lists after the ratings of changed users (and items) moved
+        
+        Only similarities that involve a changed row can move: its own list is
+        rescored, and every list it appears in just has that entry replaced.
+        extra_users are former co-raters that may have lost all overlap.
+        """
+        if self.mode == 'item':
+            # Items a changed user still rates may have lost their overlap with a changed item
+            extra_items = set()
+            for user_id in changed_users:
+                extra_items.update(self.user_item_matrix.get(user_id, ()))
+            self._refresh_rows(changed_items, extra_items, by_user=False)
+            return
+        
+        if self.approximate:
+            # Rehash the changed users; affected neighbor lists are rebuilt on next lookup
+            affected = set(extra_users)
+            for user_id in changed_users:
+                affected.add(user_id)
+                affected.update(self._co_raters(user_id))
+            for user_id in changed_users:
+                self._hash_user(user_id)
+            for user_id in affected:
+                self.user_similarities.pop(user_id, None)
+        else:
+            self._refresh_rows(changed_users, extra_users, by_user=True)
+        
+        # The CSR snapshot no longer matches the ratings
+        self.user_item_csr = None
+    
+    def _refresh_rows(self, changed, extra=(), by_user=True):
+        """Rescore the changed users (or items) and patch them into every other neighbor list"""
+        if by_user:
+            similarities, live, score = self.user_similarities, self.users, self._score_user
+        else:
+            similarities, live, score = self.item_similarities, self.items, self._score_item
+        
+        # Similarity is symmetric, so a changed row's scores are also its entry in
+        # every other row's list; rows it no longer overlaps with drop the entry
+        fresh = {}
+        affected = set(extra)
+        ids = self.store.users.ids if by_user else self.store.items.ids
+        for row_id in changed:
+            if row_id not in live:
+                fresh[row_id] = {}
+                continue
+            neighbors, dot_products = self._co_rating_scores(row_id, by_user)
+            similarities[row_id] = self._select_neighbors(neighbors)
+            fresh[row_id] = dict(neighbors)
+            affected.update(ids[j] for j in dot_products)
+        
+        limit = self.max_neighbors
+        for other_id in affected:
+            if other_id in fresh or other_id not in live:
+                continue
+            row = similarities.get(other_id, {})
+            if limit is not None and len(row) >= limit and any(
+                    row_id in row and scores.get(other_id, 0) < row[row_id]
+                    for row_id, scores in fresh.items()):
+                # A full list lost ground; whoever was cut off below it may now belong in it
+                similarities[other_id] = score(other_id)
+                continue
+            touched = [row_id for row_id, scores in fresh.items()
+                       if row_id in row or other_id in scores]
+            if len(touched) <= 2:
+                # Moving an entry costs a pass over the list, so only a couple
+                # of them are cheaper than re-ranking it once
+                for row_id in touched:
+                    row = self._move_neighbor(row, row_id, fresh[row_id].get(other_id))
+                similarities[other_id] = row
+                continue
+            neighbors = [(neighbor, similarity) for neighbor, similarity in row.items()
+                         if neighbor not in fresh]
+            neighbors.extend((row_id, scores[other_id]) for row_id, scores in fresh.items()
+                             if other_id in scores)
+            similarities[other_id] = self._select_neighbors(neighbors)
+    
+    def _move_neighbor(self, row, neighbor, similarity):
+        """Give one entry of a ranked neighbor dict a new similarity (None drops it)
+        
+        The entry lands after any equal similarities, where re-ranking the
+        whole list would put it; when its rank does not change the dict is
+        updated in place instead of rebuilt.
+        """
+        limit = self.max_neighbors
+        if neighbor in row:
+            items = list(row.items())
+            index = list(row).index(neighbor)
+            if similarity is not None and (index == 0 or items[index - 1][1] >= similarity) and (
+                    index + 1 == len(items) or similarity > items[index + 1][1]):
+                row[neighbor] = similarity
+                return row
+            del items[index]
+        elif similarity is None:
+            return row
+        elif (not row or similarity <= next(reversed(row.values()))) and (
+                limit is None or len(row) < limit):
+            row[neighbor] = similarity
+            return row
+        else:
+            items = list(row.items())
+        
+        if similarity is not None:
+            # Binary search of the descending similarities
+            lo, hi = 0, len(items)
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if items[mid][1] < similarity:
+                    hi = mid
+                else:
+                    lo = mid + 1
+            items.insert(lo, (neighbor, similarity))
+            if limit is not None:
+                del items[limit:]
+        return dict(items)
     
     def _calculate_similarities(self):
-        """Calculate cosine similarities between users"""
-        user_vectors = {}
+        """Calculate cosine similarities between users (or between items in item mode)"""
+        metrics = self.instrumentation
+        if metrics is not None:
+            start = time.perf_counter()
+        
+        parallel = self.fit_workers is not None and self.fit_workers > 1
+        if self.mode == 'item':
+            if parallel:
+                self._calculate_similarities_parallel(by_user=False)
+            else:
+                self._calculate_item_similarities()
+        elif self.approximate:
+            self._build_lsh_index()
+        elif parallel:
+            self._calculate_similarities_parallel()
+        elif self.backend == 'numpy':
+            self._calculate_similarities_numpy()
+        else:
+            self._calculate_similarities_sparse()
+        
+        if metrics is not None:
+            metrics.record('similarity', time.perf_counter() - start)
+    
+    def _calculate_similarities_sparse(self):
+        """Calculate cosine similarities with an item-to-raters inverted index"""
+        for user_id in self.users:
+            self.user_similarities[user_id] = self._score_user(user_id)
+    
+    def _score_user(self, user1):
+        """Score one user against every co-rater and rank the neighbors"""
+        return self._select_neighbors(self._co_rating_scores(user1)[0])
+    
+    def _co_rating_scores(self, row_id, by_user=True):
+        """Cosine similarities of one user (or item) to every row it shares ratings with
+        
+        Returns the (neighbor ID, similarity) pairs with a positive similarity
+        and the dot products by neighbor index, zero ones included.
+        """
+        store = self.store
+        if by_user:
+            table, norms, row, column = store.users, store.user_norms, store.user_row, store.item_column
+        else:
+            table, norms, row, column = store.items, store.item_norms, store.item_column, store.user_row
+        r = table.index.get(row_id)
+        if r is None:
+            return [], {}
+        
+        # Accumulate dot products only over co-rated items (or the users who rated both items)
+        dot_products = defaultdict(int)
+        for c, rating1 in row(r):
+            for s, rating2 in column(c):
+                dot_products[s] += rating1 * rating2
+        dot_products.pop(r, None)
+        magnitude1 = norms[r]
+        if magnitude1 == 0:
+            return [], dot_products
+        if self.instrumentation is not None:
+            self.instrumentation.count('pairs_scored', len(dot_products))
+        
+        neighbors = []
+        ids = table.ids
+        for s, dot_product in dot_products.items():
+            magnitude2 = norms[s]
+            if magnitude2 == 0:
+                continue
+            similarity = dot_product / (magnitude1 * magnitude2)
+            if similarity > 0:
+                neighbors.append((ids[s], similarity))
+        return neighbors, dot_products
+    
+    def _calculate_item_similarities(self):
+        """Calculate cosine similarities between items from their raters"""
+        for item_id in self.items:
+            self.item_similarities[item_id] = self._score_item(item_id)
+    
+    def _score_item(self, item1):
+        """Score one item against every item co-rated with it and rank the neighbors"""
+        return self._select_neighbors(self._co_rating_scores(item1, by_user=False)[0])
+    
+    def _pair_similarity(self, user1, user2):
+        """Cosine similarity of two users from their sparse rating rows"""
+        store = self.store
+        u = store.users.index.get(user1)
+        v = store.users.index.get(user2)
+        if u is None or v is None:
+            return 0
+        magnitude1 = store.user_norms[u]
+        magnitude2 = store.user_norms[v]
+        if magnitude1 == 0 or magnitude2 == 0:
+            return 0
         
-        # Create user vectors
+        # Look up the shorter row in the longer one
+        if store.user_degree(u) > store.user_degree(v):
+            u, v = v, u
+        ratings2 = dict(store.user_row(v))
+        
+        dot_product = 0
+        for i, rating in store.user_row(u):
+            if i in ratings2:
+                dot_product += rating * ratings2[i]
+        return dot_product / (magnitude1 * magnitude2)
+    
+    def _build_lsh_index(self):
+        """Hash every user into the random-hyperplane LSH tables"""
+        self.lsh_buckets = [defaultdict(set) for _ in range(self.lsh_tables)]
+        self.user_signatures = {}
+        self.user_similarities = {}
         for user_id in self.users:
-            user_vectors[user_id] = []
-            for item_id in self.items:
-                rating = self.user_item_matrix.get(user_id, {}).get(item_id, 0)
-                user_vectors[user_id].append(rating)
-        
-        # Calculate cosine similarities
-        user_list = list(self.users)
-        for i, user1 in enumerate(user_list):
-            self.user_similarities[user1] = {}
-            vec1 = user_vectors[user1]
+            self._hash_user(user_id)
+    
+    def _hyperplanes(self, item_id):
+        """Return the item's coordinates in every hyperplane, drawing them on first use"""
+        planes = self.item_hyperplanes.get(item_id)
+        if planes is None:
+            size = self.lsh_tables * self.lsh_bits
+            planes = array('d', (self._lsh_random.gauss(0, 1) for _ in range(size)))
+            self.item_hyperplanes[item_id] = planes
+        return planes
+    
+    def _hash_user(self, user_id):
+        """(Re)place a user in the LSH buckets according to its current ratings"""
+        old_signatures = self.user_signatures.pop(user_id, None)
+        if old_signatures is not None:
+            for table, signature in zip(self.lsh_buckets, old_signatures):
+                bucket = table[signature]
+                bucket.discard(user_id)
+                if not bucket:
+                    del table[signature]
+        
+        u = self.store.users.index.get(user_id)
+        if u is None or not self.store.user_degree(u):
+            return
+        
+        # Project the rating vector onto every hyperplane at once
+        projections = [0.0] * (self.lsh_tables * self.lsh_bits)
+        item_ids = self.store.items.ids
+        for i, rating in self.store.user_row(u):
+            planes = self._hyperplanes(item_ids[i])
+            projections = [p + rating * c for p, c in zip(projections, planes)]
+        
+        # One bit per hyperplane: which side of it the user falls on
+        signatures = []
+        for t, table in enumerate(self.lsh_buckets):
+            signature = 0
+            for b, projection in enumerate(projections[t * self.lsh_bits:(t + 1) * self.lsh_bits]):
+                if projection > 0:
+                    signature |= 1 << b
+            table[signature].add(user_id)
+            signatures.append(signature)
+        self.user_signatures[user_id] = signatures
+    
+    def _score_candidates(self, user_id):
+        """Score only the users sharing an LSH bucket with user_id"""
+        candidates = set()
+        for table, signature in zip(self.lsh_buckets, self.user_signatures.get(user_id, ())):
+            candidates.update(table[signature])
+        candidates.discard(user_id)
+        if self.instrumentation is not None:
+            self.instrumentation.count('pairs_scored', len(candidates))
+        
+        neighbors = []
+        for other_user in candidates:
+            similarity = self._pair_similarity(user_id, other_user)
+            if similarity > 0:
+                neighbors.append((other_user, similarity))
+        return self._select_neighbors(neighbors)
+    
+    def measure_lsh_recall(self, sample_size=100, top_k=5, seed=None):
+        """Measure approximate neighbor recall and lookup time against the exact path"""
+        if not self.approximate:
+            raise ValueError("measure_lsh_recall requires approximate=True")
+        self._ensure_index()
+        
+        users = list(self.users)
+        sample = random.Random(seed).sample(users, min(sample_size, len(users)))
+        
+        hits = 0
+        expected = 0
+        candidates = 0
+        exact_seconds = 0.0
+        approx_seconds = 0.0
+        for user_id in sample:
+            start = time.perf_counter()
+            exact = list(islice(self._score_user(user_id), top_k))
+            exact_seconds += time.perf_counter() - start
+            
+            start = time.perf_counter()
+            approx = list(islice(self._score_candidates(user_id), top_k))
+            approx_seconds += time.perf_counter() - start
             
-            for j, user2 in enumerate(user_list):
-                if i != j:
-                    vec2 = user_vectors[user2]
-                    similarity = self._cosine_similarity(vec1, vec2)
-                    if similarity > 0:
-                        self.user_similarities[user1][user2] = similarity
+            hits += len(set(exact) & set(approx))
+            expected += len(exact)
+            candidates += len(set().union(*(
+                table[signature]
+                for table, signature in zip(self.lsh_buckets, self.user_signatures.get(user_id, ()))
+            ))) - 1
+        
+        return {
+            'recall': hits / expected if expected else 1.0,
+            'users_sampled': len(sample),
+            'avg_candidates': candidates / len(sample) if sample else 0,
+            'exact_seconds': exact_seconds,
+            'approximate_seconds': approx_seconds
+        }
+    
+    def _select_neighbors(self, neighbors):
+        """Rank (user, similarity) pairs, keeping at most max_neighbors of them
+        
+        The result is ordered by descending similarity so lookups never re-sort.
+        """
+        if self.max_neighbors is None:
+            ranked = sorted(neighbors, key=lambda x: x[1], reverse=True)
+            return dict(ranked)
+        
+        # Bounded min-heap; the arrival order breaks ties so user IDs are never compared
+        heap = []
+        for order, (other_user, similarity) in enumerate(neighbors):
+            entry = (similarity, -order, other_user)
+            if len(heap) < self.max_neighbors:
+                heapq.heappush(heap, entry)
+            elif entry > heap[0]:
+                heapq.heapreplace(heap, entry)
+        
+        heap.sort(reverse=True)
+        return {other_user: similarity for similarity, _, other_user in heap}
+    
+    def _build_csr(self):
+        """Expose the compacted user-major rating arrays as a NumPy CSR matrix"""
+        store = self.store
+        store.compact()
+        dtype = np.uint8 if _typecode(store.user_ratings) == 'B' else np.float64
+        
+        # The arrays share memory with the store; only the dtype conversions copy
+        return CSRMatrix(
+            np.frombuffer(store.user_offsets, dtype=np.int64),
+            np.frombuffer(store.user_items, dtype=np.int32).astype(np.int64),
+            np.frombuffer(store.user_ratings, dtype=dtype).astype(np.float64),
+            store.users.ids,
+            store.items.ids
+        )
+    
+    def _calculate_similarities_numpy(self):
+        """Calculate cosine similarities block by block with sparse matrix products"""
+        csr = self._build_csr()
+        self.user_item_csr = csr
+        num_users = len(csr.row_ids)
+        if num_users == 0:
+            return
+        
+        # Row of every stored rating, and row norms
+        nnz_rows = np.repeat(np.arange(num_users), np.diff(csr.indptr))
+        norms = np.sqrt(np.bincount(nnz_rows, weights=csr.data * csr.data, minlength=num_users))
+        
+        # Column-major copy (item -> raters) so each block only touches co-raters
+        order = np.argsort(csr.indices, kind='stable')
+        col_rows = nnz_rows[order]
+        col_data = csr.data[order]
+        col_ptr = np.zeros(len(csr.col_ids) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(csr.indices, minlength=len(csr.col_ids)), out=col_ptr[1:])
+        
+        for start, stop in _numpy_blocks(csr.indptr, csr.indices, col_ptr, self.block_size):
+            results, pairs = _numpy_similarity_block(
+                csr.indptr, csr.indices, csr.data, norms, col_ptr, col_rows, col_data,
+                start, stop, self.max_neighbors, self.instrumentation is not None)
+            if self.instrumentation is not None:
+                self.instrumentation.count('pairs_scored', pairs)
+            for row, positive, similarities in results:
+                self.user_similarities[csr.row_ids[row]] = dict(
+                    zip([csr.row_ids[j] for j in positive.tolist()], similarities.tolist())
+                )
+    
+    def _calculate_similarities_parallel(self, by_user=True):
+        """Calculate similarities tile by tile across a process pool
+        
+        The compacted rating arrays are copied once into a shared memory
+        segment that every worker maps; tasks carry only tile bounds, and
+        workers send back only each row's ranked neighbors.
+        """
+        store = self.store
+        store.compact()
+        offsets = store.user_offsets if by_user else store.item_offsets
+        num_rows = len(offsets) - 1
+        if num_rows == 0:
+            return
+        use_numpy = by_user and self.backend == 'numpy'
+        
+        # Lay the arrays out in one segment, each on an 8-byte boundary
+        layout = {}
+        size = 0
+        for name in SHARED_SIMILARITY_ARRAYS:
+            values = getattr(store, name)
+            nbytes = len(values) * values.itemsize
+            layout[name] = (size, nbytes, _typecode(values))
+            size += (nbytes + 7) & ~7
+        segment = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        try:
+            for name, (offset, nbytes, _) in layout.items():
+                segment.buf[offset:offset + nbytes] = memoryview(getattr(store, name)).cast('B')
+            
+            if use_numpy:
+                count_pairs = self.instrumentation is not None
+                blocks = _numpy_blocks(np.frombuffer(store.user_offsets, dtype=np.int64),
+                                       np.frombuffer(store.user_items, dtype=np.int32),
+                                       np.frombuffer(store.item_offsets, dtype=np.int64),
+                                       self.block_size)
+                tasks = [(start, stop, self.max_neighbors, count_pairs) for start, stop in blocks]
+                kernel = _numpy_similarity_tile
+            else:
+                # Tiles of roughly equal rating counts, several per worker for balance
+                tiles = self.fit_workers * 8
+                bounds = sorted({bisect_left(offsets, offsets[-1] * k // tiles) for k in range(tiles)}
+                                | {num_rows})
+                bounds[0] = 0
+                tasks = [(start, stop, by_user, self.max_neighbors)
+                         for start, stop in zip(bounds, bounds[1:]) if start < stop]
+                kernel = _similarity_tile
+            
+            similarities = self.user_similarities if by_user else self.item_similarities
+            context = multiprocessing.get_context(
+                'fork' if 'fork' in multiprocessing.get_all_start_methods() else None)
+            # Forked workers inherit the ID lists; spawned ones receive them once
+            initargs = (segment.name, layout, store.users.ids, store.items.ids)
+            with context.Pool(self.fit_workers, initializer=_init_similarity_worker,
+                              initargs=initargs) as pool:
+                for results, pairs in pool.imap(kernel, tasks):
+                    if self.instrumentation is not None:
+                        self.instrumentation.count('pairs_scored', pairs)
+                    similarities.update(results)
+        finally:
+            segment.close()
+            segment.unlink()
     
     def _cosine_similarity(self, vec1, vec2):
         """Calculate cosine similarity between two vectors"""
@@ -63,81 +1583,358 @@ class SimpleExplainableRecommendationSystem:
         
         return dot_product / (magnitude1 * magnitude2)
     
-    def recommend_for_user(self, user_id, top_n=5):
-        """Generate recommendations for a specific user with explanations"""
+    def save(self, path):
+        """Save the fitted model as flat arrays that load() can memory-map
+        
+        The file is written next to path and renamed over it, so a model
+        memory-mapped from path (even this one) is never truncated under its
+        readers. User and item IDs must be str or int to survive the JSON header.
+        """
+        store = self.store
+        for ids in (store.users.ids, store.items.ids):
+            for external_id in ids:
+                if not isinstance(external_id, (str, int)):
+                    raise TypeError(f"Cannot save ID {external_id!r}: IDs must be str or int")
+        store.compact()
+        
+        # The store's arrays are written as they are, indexed by interned position
+        arrays = {name: getattr(store, name) for name in RATING_STORE_ARRAYS}
+        arrays.update(self._neighbor_arrays('', self.user_similarities, store.users.index))
+        arrays.update(self._neighbor_arrays('item_', self.item_similarities, store.items.index))
+        
+        # Lay the arrays out after the header, each starting on an 8-byte boundary
+        sections = {}
+        offset = 0
+        for name, values in arrays.items():
+            nbytes = len(values) * values.itemsize
+            sections[name] = {'typecode': _typecode(values), 'offset': offset, 'length': len(values)}
+            offset += nbytes + (-nbytes % 8)
+        
+        header = json.dumps({
+            'byteorder': sys.byteorder,
+            'config': {
+                'mode': self.mode,
+                'backend': self.backend,
+                'block_size': self.block_size,
+                'max_neighbors': self.max_neighbors,
+                'neighborhood_size': self.neighborhood_size,
+                'min_rating': self.min_rating,
+                'fit_workers': self.fit_workers,
+                'approximate': self.approximate,
+                'lsh_tables': self.lsh_tables,
+                'lsh_bits': self.lsh_bits,
+                'lsh_seed': self.lsh_seed,
+                'cache_size': self.cache.maxsize if self.cache else None,
+                'cache_ttl': self.cache.ttl if self.cache else None
+            },
+            'user_ids': store.users.ids,
+            'item_ids': store.items.ids,
+            'live_users': store.live_users,
+            'live_items': store.live_items,
+            'sections': sections
+        }).encode('utf-8')
+        header += b' ' * (-(len(MODEL_MAGIC) + 8 + len(header)) % 8)
+        
+        directory, name = os.path.split(os.path.abspath(path))
+        fd, temp_path = tempfile.mkstemp(prefix=f'.{name}.', suffix='.tmp', dir=directory)
+        # mkstemp creates the file owner-only; give it the permissions open() would have
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(fd, 0o666 & ~umask)
+        try:
+            with open(fd, 'wb') as file:
+                file.write(MODEL_MAGIC)
+                file.write(len(header).to_bytes(8, 'little'))
+                file.write(header)
+                for values in arrays.values():
+                    nbytes = len(values) * values.itemsize
+                    file.write(values)
+                    file.write(b'\0' * (-nbytes % 8))
+            os.replace(temp_path, path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+    
+    @staticmethod
+    def _neighbor_arrays(prefix, similarities, index):
+        """Flatten ranked neighbor dicts into CSR arrays keyed by interned position"""
+        # Only rows that exist are stored (approximate mode builds them lazily)
+        rows = array('i', (index[row_id] for row_id in similarities))
+        indptr = array('q', [0])
+        neighbors = array('i')
+        values = array('d')
+        for row_id in similarities:
+            # Neighbor order is the ranking, so it is preserved as stored
+            row = similarities[row_id]
+            neighbors.extend(index[other] for other in row)
+            values.extend(row.values())
+            indptr.append(len(neighbors))
+        
+        return {
+            prefix + 'neighbor_rows': rows,
+            prefix + 'neighbor_indptr': indptr,
+            prefix + 'neighbors': neighbors,
+            prefix + 'similarities': values
+        }
+    
+    @classmethod
+    def load(cls, path, mmap=True):
+        """Load a model written by save()
+        
+        With mmap=True the rating arrays and neighbor lists stay in the page
+        cache and are decoded row by row, so start-up is fast and processes
+        loading the same file share its pages. Only the per-user and per-item
+        norms are copied, since incremental updates modify them in place.
+        """
+        with open(path, 'rb') as file:
+            if file.read(len(MODEL_MAGIC)) != MODEL_MAGIC:
+                raise ValueError(f"{path} is not a saved recommendation model")
+            header_size = int.from_bytes(file.read(8), 'little')
+            header = json.loads(file.read(header_size))
+            data_start = len(MODEL_MAGIC) + 8 + header_size
+            
+            if header['byteorder'] != sys.byteorder:
+                raise ValueError("Saved model was written on a machine with a different byte order")
+            
+            if mmap:
+                buffer = mmap_module.mmap(file.fileno(), 0, access=mmap_module.ACCESS_READ)
+                view = memoryview(buffer)
+                stat = os.fstat(file.fileno())
+                identity = stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns
+            else:
+                buffer = None
+                file.seek(0)
+                view = memoryview(file.read())
+        
+        arrays = {}
+        for name, section in header['sections'].items():
+            start = data_start + section['offset']
+            stop = start + section['length'] * array(section['typecode']).itemsize
+            if mmap and name not in RATING_STORE_NORMS:
+                arrays[name] = view[start:stop].cast(section['typecode'])
+            else:
+                arrays[name] = array(section['typecode'])
+                arrays[name].frombytes(view[start:stop])
+        
+        model = cls(**header['config'])
+        store = model.store
+        store.users = _InternTable(header['user_ids'])
+        store.items = _InternTable(header['item_ids'])
+        for name in RATING_STORE_ARRAYS:
+            setattr(store, name, arrays[name])
+        store.live_users = header['live_users']
+        store.live_items = header['live_items']
+        user_ids = store.users.ids
+        item_ids = store.items.ids
+        for prefix, ids, attribute in (('', user_ids, 'user_similarities'),
+                                       ('item_', item_ids, 'item_similarities')):
+            rows = [ids[i] for i in arrays[prefix + 'neighbor_rows'].tolist()]
+            setattr(model, attribute, _CSRMapping(
+                rows, arrays[prefix + 'neighbor_indptr'], arrays[prefix + 'neighbors'],
+                arrays[prefix + 'similarities'], ids
+            ))
+        model._mapped_file = buffer
+        if mmap:
+            model._mapped_source = (os.path.abspath(path), identity, model.model_version)
+        model._index_stale = True
+        return model
+    
+    def recommend_for_user(self, user_id, top_n=5, explain=True):
+        """Generate recommendations for a specific user with explanations
+        
+        Explanations are Explanation lists of strings that also carry their
+        evidence; pass explain=False to get only item IDs and scores.
+        """
+        if self.cache is None:
+            return self._recommend_for_user(user_id, top_n, explain)
+        
+        key = (user_id, top_n, explain)
+        result = self.cache.get(key, self.model_version)
+        if result is RecommendationCache.MISSING:
+            result = self._recommend_for_user(user_id, top_n, explain)
+            self.cache.put(key, result, self.model_version)
+        # Callers may edit what they get back; the cached result must not change
+        return _copy_recommendations(result)
+    
+    def _recommend_for_user(self, user_id, top_n, explain=True):
+        """Compute recommendations for a user, bypassing the cache"""
         if user_id not in self.users:
             return [], "User not found in the system"
         
+        metrics = self.instrumentation
+        if metrics is not None:
+            started = start = time.perf_counter()
+        
         # Get user's rated items
         user_ratings = self.user_item_matrix.get(user_id, {})
         rated_items = set(user_ratings.keys())
         
-        # Find similar users
-        similar_users = self._find_similar_users(user_id)
+        # Explanation evidence is gathered while scoring, not in a second pass
+        evidence = defaultdict(list) if explain else None
         
-        # Generate recommendations
-        recommendations = self._generate_recommendations(user_id, similar_users, rated_items)
+        if self.mode == 'item':
+            recommendations = self._generate_item_recommendations(user_ratings, evidence)
+            template = ITEM_EXPLANATION
+        else:
+            # Find similar users
+            similar_users = self._find_similar_users(user_id)
+            if metrics is not None:
+                now = time.perf_counter()
+                metrics.record('neighbors', now - start)
+                start = now
+            
+            # Generate recommendations
+            recommendations = self._generate_recommendations(user_id, similar_users,
+                                                             rated_items, evidence)
+            template = USER_EXPLANATION
+        if metrics is not None:
+            now = time.perf_counter()
+            metrics.record('scoring', now - start)
+            start = now
         
         # Get top N recommendations with explanations
         top_recommendations = []
         for item_id, score in recommendations[:top_n]:
-            explanation = self._generate_explanation(user_id, item_id, similar_users)
-            top_recommendations.append({
-                'item_id': item_id,
-                'score': score,
-                'explanation': explanation
-            })
-            
+            recommendation = {'item_id': item_id, 'score': score}
+            if explain:
+                recommendation['explanation'] = Explanation(template, evidence.get(item_id, []))
+            top_recommendations.append(recommendation)
+        
+        if metrics is not None:
+            now = time.perf_counter()
+            if explain:
+                metrics.record('explanation', now - start)
+            metrics.record('recommend', now - started)
         return top_recommendations
     
-    def _find_similar_users(self, user_id, top_k=5):
-        """Find similar users based on cosine similarity"""
+    def recommend_for_users(self, user_ids, top_n=5, workers=None, chunk_size=None, explain=True):
+        """Generate recommendations for many users across a process pool
+        
+        Returns a dict mapping each user ID to its recommend_for_user result,
+        in the order the IDs were given.
+        """
+        global _worker_model
+        user_ids = list(user_ids)
+        workers = workers or os.cpu_count() or 1
+        
+        if workers == 1 or len(user_ids) <= 1:
+            return {user_id: self.recommend_for_user(user_id, top_n, explain) for user_id in user_ids}
+        
+        if chunk_size is None:
+            # A few chunks per worker keeps the pool balanced without per-user overhead
+            chunk_size = max(1, math.ceil(len(user_ids) / (workers * 4)))
+        tasks = [(user_ids[i:i + chunk_size], top_n, explain)
+                 for i in range(0, len(user_ids), chunk_size)]
+        
+        if 'fork' in multiprocessing.get_all_start_methods():
+            # Forked workers inherit the model; freezing the GC keeps its pages shared
+            context = multiprocessing.get_context('fork')
+            initargs = ()
+            _worker_model = self
+            # gc.unfreeze() thaws everything, so only a freeze that started from
+            # nothing frozen is undone afterwards
+            frozen = gc.get_freeze_count() == 0
+            gc.freeze()
+        else:
+            # Spawned workers receive the model once each, never once per task;
+            # a memory-mapped model travels as its path (see __getstate__)
+            context = multiprocessing.get_context()
+            initargs = (self,)
+            frozen = False
+        
+        results = {}
+        try:
+            with context.Pool(workers, initializer=_init_worker, initargs=initargs) as pool:
+                for chunk_results in pool.imap_unordered(_recommend_chunk, tasks):
+                    results.update(chunk_results)
+        finally:
+            _worker_model = None
+            if frozen:
+                gc.unfreeze()
+        
+        return {user_id: results[user_id] for user_id in user_ids}
+    
+    def _find_similar_users(self, user_id, top_k=None):
+        """Find similar users based on cosine similarity (neighborhood_size of them by default)"""
+        if top_k is None:
+            top_k = self.neighborhood_size
+        
+        if self.approximate and user_id in self.users and user_id not in self.user_similarities:
+            self._ensure_index()
+            self.user_similarities[user_id] = self._score_candidates(user_id)
+        
         if user_id not in self.user_similarities:
             return []
         
-        similar_users = []
-        for other_user, similarity in self.user_similarities[user_id].items():
-            similar_users.append((other_user, similarity))
-        
-        similar_users.sort(key=lambda x: x[1], reverse=True)
-        return similar_users[:top_k]
+        # Neighbors are stored in descending similarity order
+        return list(islice(self.user_similarities[user_id].items(), top_k))
     
-    def _generate_recommendations(self, user_id, similar_users, rated_items):
-        """Generate recommendations based on similar users"""
+    def _generate_recommendations(self, user_id, similar_users, rated_items, evidence=None):
+        """Generate recommendations based on similar users
+        
+        If evidence is a dict of lists, the similar users who rated each
+        candidate 4 or 5 are recorded in it as explanation evidence.
+        """
         recommendations = {}
+        min_rating = self.min_rating
+        metrics = self.instrumentation
+        considered = filtered = 0
         
+        store = self.store
+        item_ids = store.items.ids
         for other_user, similarity in similar_users:
-            other_ratings = self.user_item_matrix.get(other_user, {})
+            v = store.users.index.get(other_user)
+            if v is None:
+                continue
+            if metrics is not None:
+                considered += store.user_degree(v)
             
-            for item_id, rating in other_ratings.items():
-                if item_id not in rated_items and rating >= 3:  # Only consider items rated 3+
+            for i, rating in store.user_row(v):
+                item_id = item_ids[i]
+                if item_id not in rated_items and rating >= min_rating:  # Only consider well-rated items
                     if item_id not in recommendations:
                         recommendations[item_id] = 0
                     recommendations[item_id] += similarity * rating
+                    if evidence is not None and rating >= 4:
+                        evidence[item_id].append((other_user, similarity, rating))
+                elif metrics is not None and item_id not in rated_items:
+                    filtered += 1
+        
+        if metrics is not None:
+            metrics.count('candidates_considered', considered)
+            metrics.count('items_filtered_low_rating', filtered)
         
         # Sort by recommendation score
         sorted_recommendations = sorted(recommendations.items(), key=lambda x: x[1], reverse=True)
         return sorted_recommendations
     
-    def _generate_explanation(self, user_id, item_id, similar_users):
-        """Generate explanation for why an item is recommended"""
-        explanations = []
+    def _generate_item_recommendations(self, user_ratings, evidence=None):
+        """Generate recommendations from the neighborhoods of the user's rated items
         
-        # Check similar users who rated this item highly
-        for other_user, similarity in similar_users:
-            other_ratings = self.user_item_matrix.get(other_user, {})
-            other_rating = other_ratings.get(item_id, 0)
-            
-            if other_rating >= 4:  # Users who rated this item 4 or 5
-                explanations.append(
-                    f"Similar user {other_user} rated this item {other_rating}/5 "
-                    f"(similarity: {similarity:.2f})"
-                )
+        If evidence is a dict of lists, the user's items rated 4 or 5 that
+        vouch for each candidate are recorded in it as explanation evidence.
+        """
+        recommendations = {}
+        metrics = self.instrumentation
         
-        if not explanations:
-            explanations.append("This item is popular among users with similar preferences")
-            
-        return explanations
+        for rated_item, rating in user_ratings.items():
+            if rating < self.min_rating:  # Only well-rated items vouch for their neighbors
+                if metrics is not None:
+                    metrics.count('items_filtered_low_rating', len(self.item_similarities.get(rated_item, ())))
+                continue
+            if metrics is not None:
+                metrics.count('candidates_considered', len(self.item_similarities.get(rated_item, ())))
+            for item_id, similarity in self.item_similarities.get(rated_item, {}).items():
+                if item_id not in user_ratings:
+                    if item_id not in recommendations:
+                        recommendations[item_id] = 0
+                    recommendations[item_id] += similarity * rating
+                    if evidence is not None and rating >= 4:
+                        evidence[item_id].append((rated_item, similarity, rating))
+        
+        # Sort by recommendation score
+        sorted_recommendations = sorted(recommendations.items(), key=lambda x: x[1], reverse=True)
+        return sorted_recommendations
     
     def evaluate_explanations(self, explanations):
         """Evaluate the quality of explanations"""
@@ -156,11 +1953,66 @@ class SimpleExplainableRecommendationSystem:
             'feedback': self._get_feedback(avg_score)
         }
     
+    def evaluate(self, test_ratings, k=5, relevance_threshold=4, workers=None, explain=True):
+        """Score held-out ratings with ranking metrics
+        
+        Args:
+            test_ratings (dict): user_id -> {item_id: rating} held out from training
+            k (int): Length of the recommendation list that is scored
+            relevance_threshold (float): Held-out ratings at or above this are relevant
+            workers (int): Worker processes for recommend_for_users (None uses every CPU)
+            explain (bool): Also score the explanations with evaluate_explanations
+        
+        Users without relevant held-out items, or unknown to the model, are skipped.
+        """
+        relevant = {}
+        for user_id, ratings in test_ratings.items():
+            items = {item_id for item_id, rating in ratings.items() if rating >= relevance_threshold}
+            if items and user_id in self.users:
+                relevant[user_id] = items
+        
+        start = time.perf_counter()
+        results = self.recommend_for_users(relevant, top_n=k, workers=workers, explain=explain)
+        seconds = time.perf_counter() - start
+        
+        precision = recall = hits = 0.0
+        empty = 0
+        recommended_items = set()
+        explanations = []
+        for user_id, items in relevant.items():
+            recommendations = results[user_id]
+            if not recommendations:
+                empty += 1
+            found = sum(1 for rec in recommendations if rec['item_id'] in items)
+            precision += found / k
+            recall += found / len(items)
+            hits += 1 if found else 0
+            for rec in recommendations:
+                recommended_items.add(rec['item_id'])
+                if explain:
+                    explanations.extend(rec['explanation'])
+        
+        users = len(relevant)
+        report = {
+            'users_evaluated': users,
+            'users_without_recommendations': empty,
+            f'precision@{k}': precision / users if users else 0.0,
+            f'recall@{k}': recall / users if users else 0.0,
+            f'hit_rate@{k}': hits / users if users else 0.0,
+            'coverage': len(recommended_items) / len(self.items) if self.items else 0.0,
+            'seconds': seconds,
+            'users_per_second': users / seconds if seconds > 0 else 0.0
+        }
+        if explain:
+            report['explanations'] = self.evaluate_explanations(explanations)
+        return report
+    
     def _score_explanation(self, explanation):
         """Score an individual explanation (0-1 scale)"""
         score = 0.0
         
-        if "rated this item" in explanation and "similarity" in explanation:
+        if ("rated this item" in explanation or "you rated item" in explanation) \
+                and "similarity" in explanation:
             score += 0.8  # Specific and data-driven
         elif "popular among users" in explanation:
             score += 0.5  # General explanation
@@ -180,18 +2032,487 @@ class SimpleExplainableRecommendationSystem:
         else:
             return "Poor explanations - not very helpful"
 
-def generate_sample_data(num_users=20, num_items=15, num_interactions=100):
-    """Generate sample interaction data"""
+# MovieLens-like rating mix for skewed workloads (share of 1..5 stars)
+RATING_WEIGHTS = (0.06, 0.11, 0.27, 0.34, 0.22)
+
+def _zipf_cum_weights(n, exponent):
+    """Cumulative Zipf weights for ranks 1..n (rank 1 is the most popular)"""
+    cum_weights = []
+    total = 0.0
+    for rank in range(1, n + 1):
+        total += rank ** -exponent
+        cum_weights.append(total)
+    return cum_weights
+
+def generate_sample_data(num_users=20, num_items=15, num_interactions=100,
+                         distribution='uniform', zipf_exponent=1.0, seed=None):
+    """Generate sample interaction data
+    
+    Args:
+        num_users (int): Number of distinct user IDs to draw from
+        num_items (int): Number of distinct item IDs to draw from
+        num_interactions (int): Number of (user_id, item_id, rating) tuples
+        distribution (str): 'uniform', or 'zipf' for long-tailed user activity
+            and item popularity (user 0 and item 0 are the most active/popular)
+        zipf_exponent (float): Skew of the Zipf distribution
+        seed (int): Seed for a private random generator; None uses the
+            module-level random state
+    """
+    if distribution not in ('uniform', 'zipf'):
+        raise ValueError("distribution must be 'uniform' or 'zipf'")
+    rng = random if seed is None else random.Random(seed)
+    
+    if distribution == 'zipf':
+        # Draw everything in bulk; random.choices bisects the cumulative weights
+        user_ids = rng.choices(range(num_users), cum_weights=_zipf_cum_weights(num_users, zipf_exponent),
+                               k=num_interactions)
+        item_ids = rng.choices(range(num_items), cum_weights=_zipf_cum_weights(num_items, zipf_exponent),
+                               k=num_interactions)
+        ratings = rng.choices(range(1, 6), weights=RATING_WEIGHTS, k=num_interactions)
+        return list(zip(user_ids, item_ids, ratings))
+    
     interactions = []
     
     for _ in range(num_interactions):
-        user_id = random.randint(0, num_users - 1)
-        item_id = random.randint(0, num_items - 1)
-        rating = random.randint(1, 5)
+        user_id = rng.randint(0, num_users - 1)
+        item_id = rng.randint(0, num_items - 1)
+        rating = rng.randint(1, 5)
         interactions.append((user_id, item_id, rating))
     
     return interactions
 
+def split_interactions(interactions, test_fraction=0.2, seed=None):
+    """Hold out a share of every user's ratings for offline evaluation
+    
+    Repeated (user, item) pairs keep their last rating, as in fit. Each user
+    with at least two ratings keeps at least one in training and gives up at
+    least one for testing. Returns (train interactions, {user_id: {item_id: rating}}).
+    """
+    if not 0 < test_fraction < 1:
+        raise ValueError("test_fraction must be between 0 and 1")
+    rng = random.Random(seed)
+    
+    by_user = defaultdict(dict)
+    for user_id, item_id, rating in interactions:
+        by_user[user_id][item_id] = rating
+    
+    train = []
+    test = {}
+    for user_id, ratings in by_user.items():
+        items = list(ratings.items())
+        if len(items) >= 2:
+            rng.shuffle(items)
+            held_out = min(len(items) - 1, max(1, round(len(items) * test_fraction)))
+            test[user_id] = dict(items[:held_out])
+            items = items[held_out:]
+        train.extend((user_id, item_id, rating) for item_id, rating in items)
+    return train, test
+
+def evaluate_recommender(interactions, test_fraction=0.2, k=5, relevance_threshold=4,
+                         workers=None, seed=None, explain=True, **model_options):
+    """Split interactions, fit a model on the training part and evaluate it
+    
+    Extra keyword arguments configure the model, so a parameter sweep is a
+    loop over them, e.g. evaluate_recommender(data, neighborhood_size=10).
+    neighborhood_size and min_rating only matter at recommendation time; to
+    sweep them without refitting, set them on a fitted, uncached model and
+    call its evaluate() again. Returns evaluate()'s report plus the split
+    sizes and fit time.
+    """
+    train, test = split_interactions(interactions, test_fraction, seed)
+    
+    model = SimpleExplainableRecommendationSystem(**model_options)
+    start = time.perf_counter()
+    model.fit(train)
+    fit_seconds = time.perf_counter() - start
+    
+    report = model.evaluate(test, k=k, relevance_threshold=relevance_threshold,
+                            workers=workers, explain=explain)
+    report.update({
+        'train_interactions': len(train),
+        'test_interactions': sum(len(ratings) for ratings in test.values()),
+        'fit_seconds': fit_seconds
+    })
+    return report
+
+def _parse_rating(value):
+    """Parse a rating as an int when possible, otherwise as a float"""
+    try:
+        return int(value)
+    except ValueError:
+        return float(value)
+
+def read_interactions(path, format=None, id_type=None):
+    """Lazily yield (user_id, item_id, rating) tuples from a CSV or JSONL file
+    
+    CSV rows are user_id,item_id,rating, with an optional header row. JSONL
+    lines are objects with those keys or [user_id, item_id, rating] arrays.
+    The format is inferred from the file extension when not given.
+    """
+    if format is None:
+        format = 'jsonl' if path.endswith(('.jsonl', '.ndjson')) else 'csv'
+    if format not in ('csv', 'jsonl'):
+        raise ValueError("format must be 'csv' or 'jsonl'")
+    convert = id_type or (lambda value: value)
+    
+    with open(path, newline='', encoding='utf-8') as file:
+        if format == 'csv':
+            for line_number, row in enumerate(csv.reader(file), 1):
+                if not row:
+                    continue
+                user_id, item_id, rating = row[:3]
+                try:
+                    rating = _parse_rating(rating)
+                except ValueError:
+                    if line_number == 1:  # Header row
+                        continue
+                    raise ValueError(f"{path}:{line_number}: invalid rating {rating!r}")
+                yield convert(user_id), convert(item_id), rating
+        else:
+            for line_number, line in enumerate(file, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                    if isinstance(record, dict):
+                        record = (record['user_id'], record['item_id'], record['rating'])
+                    user_id, item_id, rating = record
+                except (ValueError, KeyError, TypeError):
+                    raise ValueError(f"{path}:{line_number}: invalid record {line.strip()!r}") from None
+                try:
+                    if isinstance(rating, str):
+                        rating = _parse_rating(rating)
+                    elif isinstance(rating, bool) or not isinstance(rating, (int, float)):
+                        raise ValueError
+                except ValueError:
+                    raise ValueError(f"{path}:{line_number}: invalid rating {rating!r}") from None
+                yield convert(user_id), convert(item_id), rating
+
+def _recommendation_payload(user_id, result):
+    """JSON-ready body for one recommend_for_user result"""
+    if isinstance(result, tuple):
+        # recommend_for_user reports unknown users as ([], message)
+        return {'user_id': user_id, 'recommendations': [], 'error': result[1]}
+    return {'user_id': user_id, 'recommendations': result}
+
+def _score_batch(model, requests):
+    """Score a micro-batch of (user_id, top_n, explain) requests and encode each as JSON
+    
+    Identical requests in the same batch are scored once.
+    """
+    encoded = {}
+    for request in requests:
+        if request not in encoded:
+            user_id, top_n, explain = request
+            payload = _recommendation_payload(user_id, model.recommend_for_user(user_id, top_n, explain))
+            encoded[request] = json.dumps(payload).encode()
+    return [encoded[request] for request in requests]
+
+def _recommend_batch(requests):
+    """Score one micro-batch inside a pool worker"""
+    return _score_batch(_worker_model, requests)
+
+class RecommendationServer:
+    """Local HTTP/JSON server for recommend_for_user built on asyncio
+    
+    Requests that arrive within batch_window seconds of each other are
+    coalesced into one scoring call, which runs on an executor so the event
+    loop keeps accepting connections while the CPU-bound work happens.
+    
+    Endpoints:
+        GET  /recommend?user_id=U&top_n=5&explain=1
+        POST /recommend   {"user_id": U, "top_n": 5, "explain": true}
+        GET  /health
+        GET  /metrics     (model.instrumentation snapshot; with workers, only
+                           what the server process itself recorded)
+    """
+    
+    REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+               413: 'Payload Too Large', 500: 'Internal Server Error'}
+    MAX_BODY = 1 << 16
+    
+    def __init__(self, model, host='127.0.0.1', port=8000, batch_window=0.002,
+                 max_batch_size=64, workers=None, id_type=None, backlog=1024):
+        """
+        Args:
+            model (SimpleExplainableRecommendationSystem): Fitted model to serve
+            host (str), port (int): Address to listen on
+            batch_window (float): Seconds to wait for more requests before scoring a batch
+            max_batch_size (int): Score immediately once this many requests are pending
+            workers (int): Size of a forked process pool for scoring; None scores
+                on a single background thread
+            id_type (callable): Converts user IDs from the query string; by
+                default an ID the model knows is used as is; otherwise query
+                strings of digits become ints and JSON numbers the model knows
+                as strings become strings
+            backlog (int): Listen backlog; bursts beyond it wait for a SYN retry
+        """
+        if batch_window < 0:
+            raise ValueError("batch_window must be non-negative")
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self.model = model
+        self.host = host
+        self.port = port
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+        self.workers = workers
+        self.id_type = id_type
+        self.backlog = backlog
+        self.batches = 0
+        self.requests = 0
+        self._pending = []
+        self._flush_handle = None
+        self._executor = None
+        self._frozen = False
+        self._server = None
+    
+    def _start_executor(self):
+        """Create the executor that scoring batches run on"""
+        if self.workers is None:
+            self._executor = ThreadPoolExecutor(max_workers=1)
+            self._score = functools.partial(_score_batch, self.model)
+            return
+        
+        # The pool starts workers lazily, so the model travels as an initializer
+        # argument; forked workers inherit it copy-on-write instead of unpickling it
+        if 'fork' in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context('fork')
+            # As in recommend_for_users, leave a caller's earlier freeze in place
+            self._frozen = gc.get_freeze_count() == 0
+            gc.freeze()
+        else:
+            context = multiprocessing.get_context()
+        self._executor = ProcessPoolExecutor(self.workers, mp_context=context,
+                                             initializer=_init_worker, initargs=(self.model,))
+        # Fork the workers now: forked later, they would inherit client sockets
+        # and hold connections open after the server closes them
+        self._executor.submit(_init_worker).result()
+        self._score = _recommend_batch
+    
+    async def start(self):
+        """Start listening; returns once the socket is bound"""
+        self._start_executor()
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port,
+                                                  backlog=self.backlog)
+        self.port = self._server.sockets[0].getsockname()[1]
+    
+    async def serve_forever(self):
+        """Start the server (if needed) and serve until cancelled"""
+        if self._server is None:
+            await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.close()
+    
+    async def close(self):
+        """Stop accepting connections and shut the executor down"""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._executor is not None:
+            # Wait for running batches off the event loop; a pool left to finish
+            # on its own can race the interpreter's exit handler
+            executor, self._executor = self._executor, None
+            await asyncio.get_running_loop().run_in_executor(
+                None, functools.partial(executor.shutdown, wait=True, cancel_futures=True))
+        if self._frozen:
+            gc.unfreeze()
+            self._frozen = False
+    
+    async def recommend(self, user_id, top_n=5, explain=True):
+        """Queue one request for the next micro-batch and return its JSON bytes"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append(((user_id, top_n, explain), future))
+        self.requests += 1
+        
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.batch_window, self._flush)
+        return await future
+    
+    def _flush(self):
+        """Hand every pending request to the executor as one batch"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        if batch:
+            self.batches += 1
+            asyncio.ensure_future(self._run_batch(batch))
+    
+    async def _run_batch(self, batch):
+        """Score a batch on the executor and resolve each request's future"""
+        loop = asyncio.get_running_loop()
+        try:
+            bodies = await loop.run_in_executor(self._executor, self._score, [request for request, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), body in zip(batch, bodies):
+            if not future.done():
+                future.set_result(body)
+    
+    def _resolve_user_id(self, value):
+        """Map a user ID from a query string or JSON body to the model's key
+        
+        Files are read with str IDs and sample data uses ints, so without an
+        id_type both spellings are tried against the model's ID table; "007"
+        stays a string when the model knows it as one.
+        """
+        if self.id_type is not None and isinstance(value, str):
+            return self.id_type(value)
+        # JSON IDs can be lists, which are not hashable model keys
+        hash(value)
+        known = self.model.store.users.index
+        if value in known or self.id_type is not None:
+            return value
+        if isinstance(value, str):
+            try:
+                return int(value)
+            except ValueError:
+                return value
+        if isinstance(value, int) and str(value) in known:
+            return str(value)
+        return value
+    
+    async def _handle_connection(self, reader, writer):
+        """Serve HTTP/1.1 requests on one connection until it closes"""
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b'\r\n\r\n')
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                except asyncio.LimitOverrunError:
+                    await self._respond(writer, 413, {'error': 'Request headers too large'}, False)
+                    break
+                
+                request_line, *header_lines = head.decode('latin-1').split('\r\n')
+                headers = {}
+                for line in header_lines:
+                    name, _, value = line.partition(':')
+                    if name:
+                        headers[name.strip().lower()] = value.strip()
+                try:
+                    method, target, version = request_line.split()
+                    length = int(headers.get('content-length', 0))
+                    if length < 0:
+                        raise ValueError(length)
+                except ValueError:
+                    await self._respond(writer, 400, {'error': 'Malformed request'}, False)
+                    break
+                if length > self.MAX_BODY:
+                    await self._respond(writer, 413, {'error': 'Request body too large'}, False)
+                    break
+                body = await reader.readexactly(length) if length else b''
+                
+                keep_alive = headers.get('connection', '').lower() != 'close' and version == 'HTTP/1.1'
+                status, payload = await self._dispatch(method, target, body)
+                await self._respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+    
+    async def _dispatch(self, method, target, body):
+        """Route one request; returns (status, dict or pre-encoded JSON bytes)"""
+        url = urlsplit(target)
+        if url.path == '/health':
+            return 200, {'status': 'ok', 'model_version': self.model.model_version,
+                         'requests': self.requests, 'batches': self.batches,
+                         'pending': len(self._pending)}
+        if url.path == '/metrics':
+            if self.model.instrumentation is None:
+                return 404, {'error': 'Instrumentation is disabled'}
+            return 200, self.model.instrumentation.snapshot()
+        if url.path != '/recommend':
+            return 404, {'error': f"No route for {url.path}"}
+        
+        try:
+            if method == 'GET':
+                query = parse_qs(url.query)
+                if 'user_id' not in query:
+                    raise ValueError("user_id is required")
+                user_id = self._resolve_user_id(query['user_id'][0])
+                top_n = int(query.get('top_n', ['5'])[0])
+                explain = query.get('explain', ['1'])[0].lower() not in ('0', 'false', 'no')
+            elif method == 'POST':
+                params = json.loads(body or b'{}')
+                if 'user_id' not in params:
+                    raise ValueError("user_id is required")
+                user_id = self._resolve_user_id(params['user_id'])
+                top_n = int(params.get('top_n', 5))
+                explain = bool(params.get('explain', True))
+            else:
+                return 405, {'error': f"Method {method} not allowed"}
+            if top_n < 1:
+                raise ValueError("top_n must be at least 1")
+        except (ValueError, TypeError) as e:
+            return 400, {'error': str(e)}
+        
+        try:
+            return 200, await self.recommend(user_id, top_n, explain)
+        except Exception as e:
+            return 500, {'error': str(e)}
+    
+    async def _respond(self, writer, status, payload, keep_alive):
+        """Write one JSON response"""
+        body = payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+        head = (f"HTTP/1.1 {status} {self.REASONS[status]}\r\n"
+                f"Content-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode('latin-1') + body)
+        await writer.drain()
+
+def serve(model_path, host='127.0.0.1', port=8000, mmap=True, instrument=False, **options):
+    """Load a saved model and serve it until interrupted
+    
+    Extra keyword arguments are passed to RecommendationServer.
+    """
+    model = SimpleExplainableRecommendationSystem.load(model_path, mmap=mmap)
+    if instrument:
+        model.instrumentation = Instrumentation()
+    server = RecommendationServer(model, host, port, **options)
+    
+    async def run():
+        await server.start()
+        print(f"Serving {model_path} on http://{server.host}:{server.port}")
+        await server.serve_forever()
+    
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+def serve_main(argv=None):
+    """Command-line entry point: serve MODEL_PATH [options]"""
+    parser = argparse.ArgumentParser(prog="simplified_recommendation_system.py serve",
+                                     description="Serve a saved model over HTTP/JSON")
+    parser.add_argument('model_path')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--batch-window', type=float, default=0.002,
+                        help="seconds to wait for more requests before scoring a batch")
+    parser.add_argument('--max-batch-size', type=int, default=64)
+    parser.add_argument('--workers', type=int,
+                        help="score on a process pool of this size instead of one thread")
+    parser.add_argument('--no-mmap', action='store_true')
+    parser.add_argument('--instrument', action='store_true', help="record timings for GET /metrics")
+    args = parser.parse_args(argv)
+    serve(args.model_path, args.host, args.port, mmap=not args.no_mmap, instrument=args.instrument,
+          batch_window=args.batch_window, max_batch_size=args.max_batch_size,
+          workers=args.workers)
+
 def main():
     """Main demonstration function"""
     print("=" * 60)
@@ -253,4 +2574,7 @@ def main():
     print("✓ Ready for demonstration")
 
 if __name__ == "__main__":
-    main()
+    if sys.argv[1:2] == ['serve']:
+        serve_main(sys.argv[2:])
+    else:
+        main()
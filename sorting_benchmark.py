@@ -0,0 +1,303 @@
+"""
+Sorting Benchmark Harness
+
+Runs every sorting engine against Python's built-in sorted() over several
+input distributions and sizes. Timings use perf_counter with warmup runs
+and repetition (GC paused); separate instrumented runs count comparisons
+and element writes and measure peak memory with tracemalloc. Results are
+emitted as JSON or CSV so runs can be compared.
+
+Usage:
+    python sorting_benchmark.py
+    python sorting_benchmark.py --sizes 1000 100000 --engines introsort sorted --format csv
+"""
+
+import argparse
+import csv
+import gc
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+from adaptive_sort import adaptive_sort
+from bubblesort import bubblesort, bubblesort_optimized
+from numeric_sort import numeric_sort
+from quicksort import introsort, parallel_sort, quicksort
+
+
+class Engine:
+    """A sorting function plus what the harness may do with it"""
+
+    def __init__(self, function, max_size=None, countable=True, writes_countable=True):
+        """
+        Args:
+            function (callable): Takes a list and returns it sorted (in place or not)
+            max_size (int): Skip larger inputs (quadratic engines)
+            countable (bool): Whether comparisons and writes can be counted; engines
+                that sort in other processes cannot be instrumented
+            writes_countable (bool): Whether the engine moves elements in the list it
+                is given; engines that sort a copy report writes as None
+        """
+        self.function = function
+        self.max_size = max_size
+        self.countable = countable
+        self.writes_countable = writes_countable
+
+
+# Register new engines here
+ENGINES = {
+    'sorted': Engine(sorted, writes_countable=False),
+    'quicksort': Engine(quicksort, max_size=100_000),
+    'introsort': Engine(introsort),
+    'adaptive_sort': Engine(adaptive_sort, writes_countable=False),
+    'parallel_sort': Engine(parallel_sort, countable=False),
+    'numeric_sort': Engine(numeric_sort, countable=False),
+    'bubblesort': Engine(bubblesort, max_size=2_000),
+    'bubblesort_optimized': Engine(bubblesort_optimized, max_size=2_000),
+}
+
+
+def _nearly_sorted(n, rng):
+    data = list(range(n))
+    for _ in range(max(1, n // 100)):
+        i, j = rng.randrange(n), rng.randrange(n)
+        data[i], data[j] = data[j], data[i]
+    return data
+
+
+DISTRIBUTIONS = {
+    'random': lambda n, rng: [rng.random() for _ in range(n)],
+    'sorted': lambda n, rng: list(range(n)),
+    'reversed': lambda n, rng: list(range(n, 0, -1)),
+    'few_unique': lambda n, rng: [rng.randrange(10) for _ in range(n)],
+    'bounded_ints': lambda n, rng: [rng.randint(1, 1000) for _ in range(n)],
+    'nearly_sorted': _nearly_sorted,
+    'organ_pipe': lambda n, rng: list(range(n // 2)) + list(range(n - n // 2, 0, -1)),
+}
+
+DEFAULT_SIZES = (100, 1_000, 10_000, 100_000)
+
+CSV_FIELDS = ('engine', 'distribution', 'size', 'status', 'correct', 'min_seconds',
+              'median_seconds', 'mean_seconds', 'stdev_seconds', 'repeats',
+              'comparisons', 'writes', 'peak_memory_bytes', 'error')
+
+
+class _Counter:
+    comparisons = 0
+
+
+class CountedValue:
+    """Wraps an element and counts every comparison made on it"""
+
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        _Counter.comparisons += 1
+        return self.value < other.value
+
+    def __le__(self, other):
+        _Counter.comparisons += 1
+        return self.value <= other.value
+
+    def __gt__(self, other):
+        _Counter.comparisons += 1
+        return self.value > other.value
+
+    def __ge__(self, other):
+        _Counter.comparisons += 1
+        return self.value >= other.value
+
+    def __eq__(self, other):
+        _Counter.comparisons += 1
+        return self.value == other.value
+
+    __hash__ = None
+
+
+class CountedList(list):
+    """List that counts element writes; a swap counts as two"""
+
+    writes = 0
+
+    def __setitem__(self, index, value):
+        self.writes += 1 if not isinstance(index, slice) else len(value)
+        super().__setitem__(index, value)
+
+
+def count_operations(function, data):
+    """Comparisons and element writes made while sorting data"""
+    counted = CountedList(CountedValue(value) for value in data)
+    _Counter.comparisons = 0
+    function(counted)
+    return _Counter.comparisons, counted.writes
+
+
+def time_engine(function, data, repeats=5, warmup=1):
+    """Time a sort on fresh copies of data; returns the per-run seconds"""
+    for _ in range(warmup):
+        function(list(data))
+
+    timings = []
+    for _ in range(repeats):
+        copy = list(data)
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            function(copy)
+            timings.append(time.perf_counter() - start)
+        finally:
+            gc.enable()
+    return timings
+
+
+def peak_memory(function, data):
+    """Peak bytes traced by tracemalloc while sorting a copy of data"""
+    copy = list(data)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        function(copy)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def benchmark(engine_name, distribution, size, repeats=5, warmup=1, seed=0, measure_counts=True,
+              measure_memory=True):
+    """Benchmark one engine on one input and return a result dict"""
+    engine = ENGINES[engine_name]
+    result = dict.fromkeys(CSV_FIELDS)
+    result.update(engine=engine_name, distribution=distribution, size=size)
+    if engine.max_size is not None and size > engine.max_size:
+        result['status'] = 'skipped'
+        return result
+
+    data = DISTRIBUTIONS[distribution](size, random.Random(seed))
+    try:
+        output = engine.function(list(data))
+        result['correct'] = list(output) == sorted(data)
+
+        timings = time_engine(engine.function, data, repeats, warmup)
+        result.update(
+            min_seconds=min(timings),
+            median_seconds=statistics.median(timings),
+            mean_seconds=statistics.mean(timings),
+            stdev_seconds=statistics.stdev(timings) if len(timings) > 1 else 0.0,
+            repeats=len(timings)
+        )
+        if measure_counts and engine.countable:
+            result['comparisons'], result['writes'] = count_operations(engine.function, data)
+            if not engine.writes_countable:
+                result['writes'] = None
+        if measure_memory:
+            result['peak_memory_bytes'] = peak_memory(engine.function, data)
+        result['status'] = 'ok'
+    except (RecursionError, MemoryError) as e:
+        # Degenerate inputs are results, not harness failures
+        result['status'] = 'failed'
+        result['error'] = type(e).__name__
+    return result
+
+
+def run_benchmarks(engines=None, distributions=None, sizes=DEFAULT_SIZES, **options):
+    """Benchmark every engine x distribution x size and return the full report"""
+    engines = list(engines or ENGINES)
+    distributions = list(distributions or DISTRIBUTIONS)
+    for name in engines:
+        if name not in ENGINES:
+            raise ValueError(f"Unknown engine {name!r}; choose from {', '.join(ENGINES)}")
+    for name in distributions:
+        if name not in DISTRIBUTIONS:
+            raise ValueError(f"Unknown distribution {name!r}; choose from {', '.join(DISTRIBUTIONS)}")
+
+    results = []
+    for size in sizes:
+        for distribution in distributions:
+            for engine in engines:
+                results.append(benchmark(engine, distribution, size, **options))
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'options': options,
+        'results': results
+    }
+
+
+def write_report(report, stream, format='json'):
+    """Write a report as JSON or as CSV (one row per result)"""
+    if format == 'json':
+        json.dump(report, stream, indent=2)
+        stream.write('\n')
+    elif format == 'csv':
+        writer = csv.DictWriter(stream, fieldnames=CSV_FIELDS)
+        writer.writeheader()
+        writer.writerows(report['results'])
+    else:
+        raise ValueError("format must be 'json' or 'csv'")
+
+
+def print_table(report, stream=sys.stdout):
+    """Human-readable summary: median time relative to sorted() per input"""
+    baseline = {(r['distribution'], r['size']): r['median_seconds']
+                for r in report['results'] if r['engine'] == 'sorted' and r['status'] == 'ok'}
+    for r in report['results']:
+        label = f"{r['engine']:<22}{r['distribution']:<15}{r['size']:>8}  "
+        if r['status'] != 'ok':
+            print(label + (r['error'] or r['status']), file=stream)
+            continue
+        line = label + f"{r['median_seconds']:.6f}s"
+        reference = baseline.get((r['distribution'], r['size']))
+        if reference and r['engine'] != 'sorted':
+            line += f"  ({r['median_seconds'] / reference:.1f}x sorted)"
+        if r['comparisons'] is not None:
+            line += f"  {r['comparisons']} cmp"
+        if r['writes'] is not None:
+            line += f", {r['writes']} writes"
+        print(line, file=stream)
+
+
+def main(argv=None):
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(description="Benchmark the sorting engines")
+    parser.add_argument('--engines', nargs='+', choices=list(ENGINES))
+    parser.add_argument('--distributions', nargs='+', choices=list(DISTRIBUTIONS))
+    parser.add_argument('--sizes', nargs='+', type=int, default=list(DEFAULT_SIZES))
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--warmup', type=int, default=1)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--no-counts', action='store_true', help="skip counting comparisons/writes")
+    parser.add_argument('--no-memory', action='store_true', help="skip the tracemalloc pass")
+    parser.add_argument('--format', choices=('json', 'csv', 'table'), default='json')
+    parser.add_argument('--output', help="write the report here instead of stdout")
+    args = parser.parse_args(argv)
+    if args.repeats < 1:
+        parser.error("--repeats must be at least 1")
+
+    report = run_benchmarks(args.engines, args.distributions, args.sizes, repeats=args.repeats,
+                            warmup=args.warmup, seed=args.seed,
+                            measure_counts=not args.no_counts, measure_memory=not args.no_memory)
+
+    def emit(stream):
+        if args.format == 'table':
+            print_table(report, stream)
+        else:
+            write_report(report, stream, args.format)
+
+    if args.output:
+        with open(args.output, 'w', newline='') as f:
+            emit(f)
+    else:
+        emit(sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,6 @@
 from quicksort import quicksort
 from bubblesort import bubblesort, bubblesort_optimized
-import time
-import random
+from sorting_benchmark import print_table, run_benchmarks
 
 def test_sorting_algorithms():
     """Test and compare both sorting algorithms"""
@@ -19,23 +18,18 @@ def test_sorting_algorithms():
     bs_result = bubblesort(test_array.copy())
     print("BubbleSort result:", bs_result)
     
-    # Test with a larger array for performance comparison
-    print("\n=== Performance Comparison with Large Array ===")
-    large_array = [random.randint(1, 1000) for _ in range(1000)]
-    
-    # QuickSort timing
-    start_time = time.time()
-    quicksort(large_array.copy())
-    qs_time = time.time() - start_time
-    
-    # BubbleSort timing
-    start_time = time.time()
-    bubblesort(large_array.copy())
-    bs_time = time.time() - start_time
-    
-    print(f"QuickSort time for 1000 elements: {qs_time:.6f} seconds")
-    print(f"BubbleSort time for 1000 elements: {bs_time:.6f} seconds")
-    print(f"QuickSort is {bs_time/qs_time:.1f}x faster than BubbleSort")
+    # Performance comparison through the benchmark harness
+    print("\n=== Performance Comparison (median of 5 runs after warmup) ===")
+    report = run_benchmarks(engines=['sorted', 'quicksort', 'introsort', 'bubblesort'],
+                            distributions=['random', 'sorted', 'few_unique'], sizes=[1000],
+                            measure_memory=False)
+    print_table(report)
+    
+    medians = {(r['engine'], r['distribution']): r['median_seconds'] for r in report['results']}
+    qs_time = medians[('quicksort', 'random')]
+    bs_time = medians[('bubblesort', 'random')]
+    print(f"QuickSort is {bs_time/qs_time:.1f}x faster than BubbleSort on 1000 random elements")
+    print("(run sorting_benchmark.py for every engine, distribution and size)")
     
     # Test with already sorted array
     print("\n=== Testing with Already Sorted Array ===")
@@ -0,0 +1,134 @@
+"""
+Tests for simplified_recommendation_system.py
+
+Run with:
+    python -m pytest -q
+"""
+
+import random
+
+import pytest
+
+from simplified_recommendation_system import SimpleExplainableRecommendationSystem, generate_sample_data
+
+
+def fitted(interactions, **options):
+    """A model fitted from scratch on interactions"""
+    model = SimpleExplainableRecommendationSystem(**options)
+    model.fit(interactions)
+    return model
+
+
+def assert_same_neighbors(actual, expected, truncated=False):
+    """
+    Same neighbor lists, ranked the same; equal similarities may swap places,
+    so a truncated list may also keep a different one of several tied neighbors
+    """
+    assert set(actual) == set(expected)
+    for row_id in expected:
+        if not truncated:
+            assert dict(actual[row_id]) == pytest.approx(dict(expected[row_id]))
+        assert list(actual[row_id].values()) == pytest.approx(list(expected[row_id].values()))
+
+
+def assert_same_model(actual, expected):
+    assert {user_id: dict(ratings) for user_id, ratings in actual.user_item_matrix.items()} == \
+        {user_id: dict(ratings) for user_id, ratings in expected.user_item_matrix.items()}
+    assert_same_neighbors(actual.user_similarities, expected.user_similarities)
+    assert_same_neighbors(actual.item_similarities, expected.item_similarities)
+
+
+def test_fit_keeps_the_last_duplicate_rating():
+    model = fitted([(1, 'a', 5), (2, 'a', 3), (1, 'a', 2), (2, 'b', 4)])
+    assert_same_model(model, fitted([(2, 'a', 3), (1, 'a', 2), (2, 'b', 4)]))
+    assert dict(model.user_item_matrix[1]) == {'a': 2}
+
+
+def test_second_fit_adds_to_the_first():
+    first = generate_sample_data(30, 20, 200, seed=1)
+    second = generate_sample_data(40, 25, 300, seed=2)
+    model = fitted(first)
+    model.fit(second)
+    assert_same_model(model, fitted(first + second))
+
+
+@pytest.mark.parametrize('rating', ['five', None, [4], object()])
+def test_fit_rejects_non_numeric_ratings(rating):
+    model = SimpleExplainableRecommendationSystem()
+    with pytest.raises(ValueError, match="must be a number"):
+        model.fit([(1, 'a', 4), (2, 'b', rating)])
+
+    # Nothing of the failed fit is left behind for the next one
+    data = generate_sample_data(20, 15, 100, seed=3)
+    model.fit(data)
+    assert_same_model(model, fitted(data))
+
+
+@pytest.mark.parametrize('mode', ['user', 'item'])
+@pytest.mark.parametrize('max_neighbors', [None, 3])
+def test_incremental_updates_match_a_fresh_fit(mode, max_neighbors):
+    rng = random.Random(5)
+    data = generate_sample_data(40, 30, 500, seed=6)
+    model = fitted(data[:300], mode=mode, max_neighbors=max_neighbors)
+    ratings = {(user_id, item_id): rating for user_id, item_id, rating in data[:300]}
+    attribute = 'user_similarities' if mode == 'user' else 'item_similarities'
+
+    for step in range(30):
+        if step % 3 == 2:
+            user_id, item_id = rng.choice(sorted(ratings))
+            model.remove_interaction(user_id, item_id)
+            del ratings[user_id, item_id]
+        else:
+            # Batches of one or two ratings patch neighbor lists; bigger ones re-rank them
+            batch = data[300 + step * 6:300 + step * 6 + rng.randint(1, 6)]
+            model.partial_fit(batch)
+            ratings.update({(user_id, item_id): rating for user_id, item_id, rating in batch})
+
+        expected = fitted([(user_id, item_id, rating) for (user_id, item_id), rating in ratings.items()],
+                          mode=mode, max_neighbors=max_neighbors)
+        assert_same_neighbors(getattr(model, attribute), getattr(expected, attribute),
+                              truncated=max_neighbors is not None)
+
+
+@pytest.mark.parametrize('mmap', [True, False])
+def test_save_and_load_round_trip(tmp_path, mmap):
+    data = [(f"user{user_id}", item_id, rating) for user_id, item_id, rating
+            in generate_sample_data(30, 20, 250, seed=7)]
+    model = fitted(data, max_neighbors=5)
+    path = tmp_path / 'model.bin'
+    model.save(path)
+
+    loaded = SimpleExplainableRecommendationSystem.load(path, mmap=mmap)
+    assert_same_model(loaded, model)
+    for user_id in model.users:
+        assert loaded.recommend_for_user(user_id) == model.recommend_for_user(user_id)
+
+    # A loaded model keeps learning, and can be saved over the file it maps
+    loaded.partial_fit([('user0', 3, 5), ('new user', 3, 4)])
+    loaded.remove_interaction('user1', next(iter(loaded.user_item_matrix['user1'])))
+    loaded.save(path)
+    reloaded = SimpleExplainableRecommendationSystem.load(path, mmap=mmap)
+    assert_same_model(reloaded, loaded)
+
+
+def test_save_rejects_ids_json_cannot_hold(tmp_path):
+    model = fitted([((1, 2), 'a', 4), ('user', 'a', 3)])
+    with pytest.raises(TypeError, match="IDs must be str or int"):
+        model.save(tmp_path / 'model.bin')
+
+
+def test_load_rejects_other_files(tmp_path):
+    path = tmp_path / 'model.bin'
+    path.write_bytes(b'not a model')
+    with pytest.raises(ValueError, match="not a saved recommendation model"):
+        SimpleExplainableRecommendationSystem.load(path)
+
+
+def test_partial_fit_rejects_a_bad_batch_without_applying_any_of_it():
+    data = generate_sample_data(20, 15, 100, seed=4)
+    model = fitted(data)
+    version = model.model_version
+    with pytest.raises(ValueError, match="must be a number"):
+        model.partial_fit([(0, 0, 5), (1, 1, 'x')])
+    assert model.model_version == version
+    assert_same_model(model, fitted(data))